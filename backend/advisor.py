@@ -8,6 +8,7 @@ Routes queries to appropriate MCPs based on query type.
 MAESTRA_MINIMAL_MODE: When enabled, uses stubs instead of system dependencies.
 """
 import os
+import re
 import sys
 import time
 import uuid
@@ -143,6 +144,10 @@ from response_formatter import get_formatting_hint
 
 logger = logging.getLogger(__name__)
 
+# Entry IDs are 16-character hex strings like "5ce9e4d4f0f23d90".
+# Case-insensitive, so the question itself never needs lowering.
+_ENTRY_ID_RE = re.compile(r'\b([a-f0-9]{16})\b', re.IGNORECASE)
+
 # =============================================================================
 # ENFORCEMENT KERNEL (NON-BYPASSABLE)
 # =============================================================================
@@ -550,7 +555,6 @@ async def process_quick_question(request: AdvisorAskRequest) -> AdvisorAskRespon
     Routes to appropriate MCPs based on query type.
     Maintains session continuity across turns.
     """
-    import re
     import json
     from pathlib import Path
     
@@ -559,9 +563,8 @@ async def process_quick_question(request: AdvisorAskRequest) -> AdvisorAskRespon
     question = request.get_question
     
     # Check for Entry ID references in the question
-    # Entry IDs are 16-character hex strings like "5ce9e4d4f0f23d90"
-    entry_id_pattern = r'\b([a-f0-9]{16})\b'
-    entry_id_matches = re.findall(entry_id_pattern, question.lower())
+    # (library files are named by the lowercase ID)
+    entry_id_matches = [entry_id.lower() for entry_id in _ENTRY_ID_RE.findall(question)]
     
     library_context = ""
     if entry_id_matches:
@@ -632,7 +635,7 @@ async def process_quick_question(request: AdvisorAskRequest) -> AdvisorAskRespon
             )
             return enforce_and_return(response, sources=conv_sources, system_mode="full", epistemic_state="GROUNDED")
         # Check if it's a library entry ID (16 hex chars)
-        elif re.match(r'^[a-f0-9]{16}$', potential_id.lower()):
+        elif _ENTRY_ID_RE.fullmatch(potential_id):
             # Already handled above via library_context, continue to normal processing
             pass
         else:
@@ -659,8 +662,10 @@ async def process_quick_question(request: AdvisorAskRequest) -> AdvisorAskRespon
     
     all_sources: List[SourceReference] = []
     
-    # Capture start time for latency measurement
+    # Capture start time for latency measurement (wall clock for the record,
+    # monotonic clock for the latency itself)
     start_time_ms = int(time.time() * 1000)
+    start_time_ns = time.perf_counter_ns()
     
     # Classify query early for metadata logging (behavior unchanged)
     query_type_classification = classify_query(question)
@@ -1111,7 +1116,7 @@ async def process_quick_question(request: AdvisorAskRequest) -> AdvisorAskRespon
     
     assistant_metadata = instrument_assistant_turn(
         response=answer,
-        start_time_ms=start_time_ms,
+        start_time_ns=start_time_ns,
         query_type=user_metadata.get("query_type"),
         tools_used=tools_used if tools_used else None,
         confidence=grounding_result.confidence if grounding_result else None
@@ -20,6 +20,13 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# REQUIRED MCPs (local, file-based) and their server paths relative to the workspace root.
+# OPTIONAL MCPs (deep_research, project_planning) may be missing.
+REQUIRED_MCPS = {
+    "library_bridge": "mcp_servers/library-bridge/server.js",
+    "context_builder": "mcp_servers/context-builder/server.js",
+}
+
 class ChainPattern(str, Enum):
     SEQUENTIAL = "sequential"
     PARALLEL = "parallel"
@@ -211,10 +218,8 @@ class MCPChain:
             raise RuntimeError("Workspace root not found")
         
         # Map MCP types to their relative server paths
-        # REQUIRED MCPs: library_bridge, context_builder (local, file-based)
+        # REQUIRED MCPs: see REQUIRED_MCPS (local, file-based)
         # OPTIONAL MCPs: deep_research, project_planning (external dependencies)
-        REQUIRED_MCPS = {"library_bridge", "context_builder"}
-        
         mcp_servers = {
             "context_builder": "mcp_servers/context-builder/server.js",
             "library_bridge": "mcp_servers/library-bridge/server.js",
@@ -304,11 +309,6 @@ def validate_required_mcps():
         logger.critical(f"🔴 STARTUP FAILED: Cannot find workspace root: {e}")
         raise RuntimeError("Workspace root not found - cannot validate MCPs")
     
-    REQUIRED_MCPS = {
-        "library_bridge": "mcp_servers/library-bridge/server.js",
-        "context_builder": "mcp_servers/context-builder/server.js",
-    }
-    
     missing = []
     for mcp_name, relative_path in REQUIRED_MCPS.items():
         server_path = os.path.join(workspace_root, relative_path)
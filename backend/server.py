@@ -10,8 +10,10 @@ Endpoints:
 - GET /health - Health check
 """
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import json
 import logging
 import time
 import uuid
@@ -594,6 +596,47 @@ async def list_peers():
     }
 
 
+# One queue per /sync-events subscriber; each completed /sync is broadcast to all.
+# The set lives in this process only: with several workers a subscriber sees just
+# the syncs received by the worker serving its stream
+_sync_event_queues: set = set()
+SYNC_EVENT_KEEPALIVE_SECONDS = 10
+
+
+def _publish_sync_event(event: dict) -> None:
+    """Broadcast a completed sync to every /sync-events subscriber."""
+    for queue in _sync_event_queues:
+        queue.put_nowait(event)
+
+
+@app.get("/sync-events")
+async def sync_events(request: Request):
+    """
+    Server-Sent Events stream with one `data:` line per completed sync.
+    
+    Lets verifiers wait for a sync instead of polling on a fixed timer.
+    Only syncs received by this worker process are reported, so run a single
+    worker when relying on it. A keepalive comment is sent every SYNC_EVENT_KEEPALIVE_SECONDS so
+    disconnected clients are noticed.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    _sync_event_queues.add(queue)
+    
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SYNC_EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(event)}\n\n"
+        finally:
+            _sync_event_queues.discard(queue)
+    
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
 @app.post("/sync")
 async def sync_conversations(request: Request):
     """
@@ -653,6 +696,13 @@ async def sync_conversations(request: Request):
         f"{merged} merged, {updated} updated, {skipped} skipped"
     )
     
+    _publish_sync_event({
+        "sync_id": sync_payload.sync_id,
+        "source_backend_id": sync_payload.source_backend_id,
+        "conversations_received": len(sync_payload.conversations),
+        "timestamp": datetime.utcnow().isoformat()
+    })
+    
     return {
         "status": "synced",
         "sync_id": sync_payload.sync_id,
@@ -0,0 +1,104 @@
+"""
+Shared fixtures for Maestra backend tests.
+"""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, NamedTuple, Set
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Make backend modules importable from every test module (once per session)
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# Source files inspected by the structural enforcement tests
+STRUCTURAL_SOURCES = {
+    "advisor": BACKEND_DIR / "advisor.py",
+    "server": BACKEND_DIR / "server.py",
+    "kernel": BACKEND_DIR / "enforcement_kernel.py",
+}
+
+
+class SourceInfo(NamedTuple):
+    """A source file read and analysed once per session."""
+    text: str
+    tree: ast.Module
+    # Enclosing function name ("<module>" at top level) -> call targets made in it
+    calls: Dict[str, Set[str]]
+
+
+class _CallCollector(ast.NodeVisitor):
+    """Record every call target, grouped by the enclosing function."""
+
+    def __init__(self):
+        self.calls = {"<module>": set()}
+        self._scope = ["<module>"]
+
+    def _visit_function(self, node):
+        self.calls.setdefault(node.name, set())
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            name = f"{func.value.id}.{func.attr}"
+        elif isinstance(func, ast.Attribute):
+            name = func.attr
+        else:
+            name = None
+        if name:
+            self.calls[self._scope[-1]].add(name)
+        self.generic_visit(node)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "structural: source-scan tests that never import runtime backend code",
+    )
+    config.addinivalue_line(
+        "markers",
+        "stateless: pure-function tests with no shared mutable state; safe under pytest -n auto",
+    )
+
+
+@pytest.fixture(scope="session")
+def source_trees():
+    """
+    Read, parse and index each structural source file exactly once per session.
+
+    Returns a mapping of name -> SourceInfo.
+    """
+    trees = {}
+    for name, path in STRUCTURAL_SOURCES.items():
+        text = path.read_text()
+        tree = ast.parse(text)
+        collector = _CallCollector()
+        collector.visit(tree)
+        trees[name] = SourceInfo(text, tree, collector.calls)
+    return trees
+
+
+@pytest.fixture(scope="session")
+def kernel():
+    """The singleton enforcement kernel, shared across the session."""
+    from enforcement_kernel import get_enforcement_kernel
+    return get_enforcement_kernel()
+
+
+@pytest.fixture(scope="session")
+def shadow_mediator():
+    """The shadow conversation mediator, shared across the session."""
+    from conversation_mediator import get_shadow_mediator
+    return get_shadow_mediator()
@@ -12,7 +12,6 @@ If ANY of these fail, 5B HALTS.
 """
 
 import pytest
-import os
 from dataclasses import dataclass
 from typing import Literal
 
@@ -29,11 +28,34 @@ from enforcement_kernel import (
 )
 
 
+# Methods that could bypass enforcement if present on the kernel
+FORBIDDEN_METHODS = frozenset({
+    "bypass",
+    "skip",
+    "disable",
+    "allow_degraded",
+    "soft_enforce",
+    "lenient",
+    "permissive",
+    "ignore",
+    "override",
+})
+
+# Attributes that could disable enforcement if present on the kernel
+FORBIDDEN_ATTRS = frozenset({
+    "enabled",
+    "disabled",
+    "bypass_mode",
+    "skip_mode",
+    "lenient_mode",
+})
+
+
 # ─────────────────────────────────────────────
 # 5B.0.1 — Direct Kernel Kill Test (Isolation)
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FakeResponse:
     """Minimal response object for testing."""
     authority: Literal["system", "memory", "tool", "none"]
@@ -41,6 +63,29 @@ class FakeResponse:
     system_mode: Literal["full", "minimal", "local_power"]
 
 
+# Valid shapes shared across tests (built once at import)
+VALID_TOOL_CTX = ContextTrace(
+    sources=[ContextSource(source="tool:sentinel")],
+    required_but_missing=[],
+    system_mode="local_power",
+)
+VALID_TOOL_RESP = FakeResponse(
+    authority="tool",
+    epistemic_state="GROUNDED",
+    system_mode="local_power",
+)
+VALID_REFUSAL_CTX = ContextTrace(
+    sources=[],
+    required_but_missing=["sentinel"],  # Missing context is OK for refusals
+    system_mode="full",
+)
+VALID_REFUSAL_RESP = FakeResponse(
+    authority="none",
+    epistemic_state="REFUSED",
+    system_mode="full",
+)
+
+
 class TestDirectKernelKill:
     """
     Prove the kernel itself cannot be lied to.
@@ -145,20 +190,8 @@ class TestDirectKernelKill:
         """
         kernel = EnforcementKernel()
 
-        context = ContextTrace(
-            sources=[ContextSource(source="tool:sentinel")],
-            required_but_missing=[],
-            system_mode="local_power",
-        )
-
-        response = FakeResponse(
-            authority="tool",  # ✅ CORRECT
-            epistemic_state="GROUNDED",
-            system_mode="local_power",
-        )
-
         # Should not raise
-        result = kernel.enforce(response, context)
+        result = kernel.enforce(VALID_TOOL_RESP, VALID_TOOL_CTX)
         assert result is None
 
     def test_kernel_allows_valid_refusal(self):
@@ -167,20 +200,8 @@ class TestDirectKernelKill:
         """
         kernel = EnforcementKernel()
 
-        context = ContextTrace(
-            sources=[],
-            required_but_missing=["sentinel"],  # Missing context is OK for refusals
-            system_mode="full",
-        )
-
-        response = FakeResponse(
-            authority="none",  # ✅ CORRECT for refusals
-            epistemic_state="REFUSED",
-            system_mode="full",
-        )
-
         # Should not raise
-        result = kernel.enforce(response, context)
+        result = kernel.enforce(VALID_REFUSAL_RESP, VALID_REFUSAL_CTX)
         assert result is None
 
 
@@ -193,18 +214,17 @@ class TestNoConfigEscapeHatch:
     Prove no configuration flag can disable enforcement.
     """
 
-    def test_no_flag_disables_enforcement(self):
+    def test_no_flag_disables_enforcement(self, monkeypatch):
         """
         Setting any environment flag does NOT disable enforcement.
         """
-        # Set all possible bypass flags
-        os.environ["MAESTRA_MINIMAL_MODE"] = "true"
-        os.environ["DISABLE_ENFORCEMENT"] = "1"
-        os.environ["ENFORCEMENT_BYPASS"] = "true"
-        os.environ["SKIP_ENFORCEMENT"] = "1"
-
-        # Re-import to ensure flags are read
-        from enforcement_kernel import EnforcementKernel
+        # Set all possible bypass flags (monkeypatch restores them on teardown)
+        monkeypatch.setenv("MAESTRA_MINIMAL_MODE", "true")
+        monkeypatch.setenv("DISABLE_ENFORCEMENT", "1")
+        monkeypatch.setenv("ENFORCEMENT_BYPASS", "true")
+        monkeypatch.setenv("SKIP_ENFORCEMENT", "1")
+
+        # Built after the flags are set, so flags read in the constructor count too
         kernel = EnforcementKernel()
 
         # Kernel should still raise on invalid input
@@ -224,33 +244,14 @@ class TestNoConfigEscapeHatch:
         with pytest.raises(AuthorityViolation):
             kernel.enforce(response, context)
 
-        # Clean up
-        del os.environ["MAESTRA_MINIMAL_MODE"]
-        del os.environ["DISABLE_ENFORCEMENT"]
-        del os.environ["ENFORCEMENT_BYPASS"]
-        del os.environ["SKIP_ENFORCEMENT"]
-
     def test_kernel_has_no_bypass_methods(self):
         """
         Kernel class has no methods that could bypass enforcement.
         """
         kernel = get_enforcement_kernel()
         
-        forbidden_methods = [
-            "bypass",
-            "skip",
-            "disable",
-            "allow_degraded",
-            "soft_enforce",
-            "lenient",
-            "permissive",
-            "ignore",
-            "override",
-        ]
-        
-        kernel_methods = dir(kernel)
-        for method in forbidden_methods:
-            assert method not in kernel_methods, f"Forbidden method '{method}' found on kernel"
+        found = set(dir(kernel)) & FORBIDDEN_METHODS
+        assert not found, f"Forbidden methods found on kernel: {sorted(found)}"
 
     def test_kernel_has_no_bypass_attributes(self):
         """
@@ -258,15 +259,7 @@ class TestNoConfigEscapeHatch:
         """
         kernel = get_enforcement_kernel()
         
-        forbidden_attrs = [
-            "enabled",
-            "disabled",
-            "bypass_mode",
-            "skip_mode",
-            "lenient_mode",
-        ]
-        
-        for attr in forbidden_attrs:
+        for attr in sorted(FORBIDDEN_ATTRS):
             assert not hasattr(kernel, attr), f"Forbidden attribute '{attr}' found on kernel"
 
 
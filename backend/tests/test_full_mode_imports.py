@@ -10,8 +10,31 @@ If someone reintroduces old paths → CI explodes.
 """
 import os
 import importlib
+from typing import get_args
+
 import pytest
 
+# Import checks only mean something in full mode; test_full_mode_enforced
+# stays unconditional so a minimal-mode CI run still fails loudly
+full_mode_only = pytest.mark.skipif(
+    os.getenv("MAESTRA_MINIMAL_MODE", "false").lower() != "false",
+    reason="requires full mode (MAESTRA_MINIMAL_MODE=false)",
+)
+
+
+# These MUST exist and import successfully in full mode
+REQUIRED_MODULES = (
+    "routing.context_router",
+    "routing.memory_gate",
+    "routing.maestra_memory",
+)
+
+# These MUST NOT be importable - they are legacy/wrong paths
+FORBIDDEN_MODULES = (
+    "gates.memory_gate",
+    "backend_8825.maestra_memory",
+)
+
 
 def test_full_mode_enforced():
     """CI must run with MAESTRA_MINIMAL_MODE=false"""
@@ -21,37 +44,26 @@ def test_full_mode_enforced():
     )
 
 
-def test_required_modules_importable():
-    """These MUST exist and import successfully in full mode"""
-    required_modules = [
-        "routing.context_router",
-        "routing.memory_gate",
-        "routing.maestra_memory",
-    ]
-
-    for mod in required_modules:
-        try:
-            importlib.import_module(mod)
-        except Exception as e:
-            pytest.fail(f"❌ Required module failed to import: {mod}\n{e}")
-
+@full_mode_only
+@pytest.mark.parametrize("mod", REQUIRED_MODULES, ids=lambda m: m)
+def test_required_modules_importable(mod):
+    """Each required module must import successfully in full mode"""
+    try:
+        importlib.import_module(mod)
+    except Exception as e:
+        pytest.fail(f"❌ Required module failed to import: {mod}\n{e}")
 
-def test_forbidden_legacy_paths_blocked():
-    """These MUST NOT be importable - they are legacy/wrong paths"""
-    forbidden_modules = [
-        "gates.memory_gate",
-        "backend_8825.maestra_memory",
-    ]
 
-    for mod in forbidden_modules:
-        try:
-            importlib.import_module(mod)
-            pytest.fail(f"❌ Forbidden legacy module should NOT exist: {mod}")
-        except ModuleNotFoundError:
-            pass  # Expected - this is correct
-        except Exception as e:
-            # Other errors are also acceptable (means it doesn't work)
-            pass
+@pytest.mark.parametrize("mod", FORBIDDEN_MODULES, ids=lambda m: m)
+def test_forbidden_legacy_paths_blocked(mod):
+    """Each legacy/wrong module path must not be importable"""
+    try:
+        importlib.import_module(mod)
+    except ModuleNotFoundError:
+        return  # Expected - this is correct
+    except Exception:
+        return  # Other errors are also acceptable (means it doesn't work)
+    pytest.fail(f"❌ Forbidden legacy module should NOT exist: {mod}")
 
 
 def test_response_contains_truth_fields():
@@ -68,12 +80,11 @@ def test_response_contains_truth_fields():
         assert field in fields, f"❌ Missing truth field: {field}"
     
     # Verify system_mode is a Literal type with correct values
-    system_mode_annotation = fields["system_mode"].annotation
-    assert "full" in str(system_mode_annotation), "❌ system_mode must include 'full'"
-    assert "minimal" in str(system_mode_annotation), "❌ system_mode must include 'minimal'"
+    system_mode_values = set(get_args(fields["system_mode"].annotation))
+    assert {"full", "minimal"} <= system_mode_values, \
+        "❌ system_mode must include 'full' and 'minimal'"
     
     # Verify authority is a Literal type with correct values
-    authority_annotation = fields["authority"].annotation
-    assert "system" in str(authority_annotation), "❌ authority must include 'system'"
-    assert "memory" in str(authority_annotation), "❌ authority must include 'memory'"
-    assert "none" in str(authority_annotation), "❌ authority must include 'none'"
+    authority_values = set(get_args(fields["authority"].annotation))
+    assert {"system", "memory", "none"} <= authority_values, \
+        "❌ authority must include 'system', 'memory' and 'none'"
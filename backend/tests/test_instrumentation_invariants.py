@@ -7,22 +7,15 @@ CRITICAL: All tests must pass to prove instrumentation is observation-only.
 """
 
 import pytest
-import asyncio
+import ast
+import importlib.util
 from typing import Dict, Any
 
-# Import the advisor logic
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from models import AdvisorAskRequest
-
 
 class TestEnforcementInvariants:
     """Test that enforcement kernel behavior is unchanged."""
     
-    @pytest.mark.asyncio
-    async def test_enforcement_kernel_unchanged(self):
+    def test_enforcement_kernel_unchanged(self):
         """
         Enforcement kernel behavior must be identical with/without instrumentation.
         
@@ -33,27 +26,31 @@ class TestEnforcementInvariants:
         # 2. Run same query with instrumentation disabled
         # 3. Assert enforcement decisions are identical
         
-        # For now, we verify enforcement kernel is not imported by instrumentation
-        from turn_instrumentation import instrument_user_turn
-        from conversation_mediator import get_shadow_mediator
-        from user_interaction_profile import get_user_profile
-        
-        # None of these modules should import enforcement_kernel
-        import turn_instrumentation
-        import conversation_mediator
-        import user_interaction_profile
-        
-        # Verify no enforcement_kernel in module globals
-        assert 'enforcement_kernel' not in dir(turn_instrumentation)
-        assert 'enforcement_kernel' not in dir(conversation_mediator)
-        assert 'enforcement_kernel' not in dir(user_interaction_profile)
-        
-        assert True  # Placeholder for actual test
+        # For now, we verify enforcement kernel is not imported by instrumentation.
+        # Read each module's source instead of importing it, so module-level
+        # side effects never run.
+        for module_name in ("turn_instrumentation", "conversation_mediator", "user_interaction_profile"):
+            spec = importlib.util.find_spec(module_name)
+            assert spec is not None and spec.origin, f"{module_name} not found"
+            
+            with open(spec.origin) as f:
+                tree = ast.parse(f.read())
+            
+            imported = set()
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    imported.update(alias.name for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.module:
+                    imported.add(node.module)
+            
+            assert 'enforcement_kernel' not in imported, \
+                f"{module_name} must not import enforcement_kernel"
 
 
 class TestAuthorityInvariants:
     """Test that authority determination is unchanged."""
     
+    @pytest.mark.skip(reason="placeholder - no real assertion yet")
     def test_authority_not_affected_by_metadata(self):
         """
         Authority determination must not depend on turn metadata.
@@ -79,6 +76,7 @@ class TestAuthorityInvariants:
         # This is verified in advisor.py logic
         assert True  # Placeholder for actual test
     
+    @pytest.mark.skip(reason="placeholder - no real assertion yet")
     def test_authority_fields_present(self):
         """
         Authority field must always be present in responses.
@@ -139,10 +137,19 @@ class TestToolAssertionInvariants:
         assert True
 
 
+@pytest.fixture(scope="module")
+def inject_params():
+    """Parameter names of inject_context_into_prompt, introspected once."""
+    from context_injection import inject_context_into_prompt
+    import inspect
+    
+    return set(inspect.signature(inject_context_into_prompt).parameters)
+
+
 class TestResponseContentInvariants:
     """Test that response content is unchanged."""
     
-    def test_metadata_does_not_affect_response_text(self):
+    def test_metadata_does_not_affect_response_text(self, inject_params):
         """
         Response text must be identical with/without metadata.
         
@@ -155,89 +162,84 @@ class TestResponseContentInvariants:
         # 4. Assert response text is identical
         
         # For now, verify metadata is not passed to LLM
-        from context_injection import inject_context_into_prompt
-        import inspect
-        
-        # Get function signature
-        sig = inspect.signature(inject_context_into_prompt)
-        params = list(sig.parameters.keys())
-        
-        # Verify metadata is not a parameter
-        assert 'metadata' not in params
-        assert 'turn_metadata' not in params
-        assert 'user_metadata' not in params
-        assert 'mediator_decision' not in params
+        assert 'metadata' not in inject_params
+        assert 'turn_metadata' not in inject_params
+        assert 'user_metadata' not in inject_params
+        assert 'mediator_decision' not in inject_params
         
         assert True
     
-    def test_shadow_mediator_not_used_in_prompts(self):
+    def test_shadow_mediator_not_used_in_prompts(self, inject_params):
         """
         Shadow mediator decisions must not affect prompts.
         
         Test: Mediator output should not be passed to inject_context_into_prompt.
         """
-        from context_injection import inject_context_into_prompt
-        import inspect
-        
-        # Get function signature
-        sig = inspect.signature(inject_context_into_prompt)
-        params = list(sig.parameters.keys())
-        
         # Verify mediator decision is not a parameter
-        assert 'mediator_decision' not in params
-        assert 'verbosity' not in params
-        assert 'structure' not in params
-        assert 'show_reasoning' not in params
+        assert 'mediator_decision' not in inject_params
+        assert 'verbosity' not in inject_params
+        assert 'structure' not in inject_params
+        assert 'show_reasoning' not in inject_params
         
         assert True
 
 
+@pytest.fixture(scope="module")
+def two_turns():
+    """Two turns from different sessions, built once per module."""
+    from session_continuity import ConversationTurn
+    
+    turn1 = ConversationTurn(
+        turn_id="turn1",
+        type="user_query",
+        timestamp="2026-01-29T00:00:00Z",
+        content="Test query 1",
+        metadata={"session_id": "session1"}
+    )
+    
+    turn2 = ConversationTurn(
+        turn_id="turn2",
+        type="user_query",
+        timestamp="2026-01-29T00:01:00Z",
+        content="Test query 2",
+        metadata={"session_id": "session2"}
+    )
+    
+    return turn1, turn2
+
+
+@pytest.fixture(scope="module")
+def two_profiles():
+    """Profiles for two different users, built once per module."""
+    from user_interaction_profile import UserInteractionProfile
+    
+    return UserInteractionProfile(user_id="user1"), UserInteractionProfile(user_id="user2")
+
+
 class TestMetadataIsolation:
     """Test that metadata is properly isolated."""
     
-    def test_metadata_session_scoped(self):
+    def test_metadata_session_scoped(self, two_turns):
         """
         Metadata must be session-scoped, not cross-session.
         
         Test: Metadata should not leak across sessions.
         """
-        from session_continuity import ConversationTurn
-        
-        # Create two turns with different session IDs
-        turn1 = ConversationTurn(
-            turn_id="turn1",
-            type="user_query",
-            timestamp="2026-01-29T00:00:00Z",
-            content="Test query 1",
-            metadata={"session_id": "session1"}
-        )
-        
-        turn2 = ConversationTurn(
-            turn_id="turn2",
-            type="user_query",
-            timestamp="2026-01-29T00:01:00Z",
-            content="Test query 2",
-            metadata={"session_id": "session2"}
-        )
+        turn1, turn2 = two_turns
         
         # Metadata should be isolated
         assert turn1.metadata["session_id"] != turn2.metadata["session_id"]
-        assert True
     
-    def test_profile_user_scoped(self):
+    def test_profile_user_scoped(self, two_profiles):
         """
         User profiles must be user-scoped, not cross-user.
         
         Test: Profiles should not leak across users.
         """
-        from user_interaction_profile import UserInteractionProfile
-        
-        profile1 = UserInteractionProfile(user_id="user1")
-        profile2 = UserInteractionProfile(user_id="user2")
+        profile1, profile2 = two_profiles
         
         # Profiles should be isolated
         assert profile1.user_id != profile2.user_id
-        assert True
 
 
 class TestInstrumentationObservability:
@@ -264,17 +266,13 @@ class TestInstrumentationObservability:
         # (verified by checking advisor.py doesn't branch on these)
         assert True
     
-    def test_shadow_mediator_logs_only(self):
+    def test_shadow_mediator_logs_only(self, shadow_mediator):
         """
         Shadow mediator should compute decisions without applying them.
         
         Test: Mediator decisions should be logged but not used.
         """
-        from conversation_mediator import get_shadow_mediator
-        
-        mediator = get_shadow_mediator()
-        
-        decision = mediator.compute_decision(
+        decision = shadow_mediator.compute_decision(
             query="Test query",
             recent_turns=[],
             query_metadata={"query_type": "explore"}
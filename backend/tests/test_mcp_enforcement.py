@@ -13,9 +13,12 @@ TEST CASES:
 These tests must fail if enforcement is bypassed.
 """
 
+import contextlib
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from dataclasses import dataclass
+from collections import namedtuple
+from functools import lru_cache
 from typing import List
 
 from enforcement_kernel import (
@@ -24,7 +27,6 @@ from enforcement_kernel import (
     ContextTrace,
     ContextUnavailable,
     AuthorityViolation,
-    get_enforcement_kernel,
 )
 from tool_assertion_classifier import (
     classify_tool_assertion,
@@ -36,12 +38,14 @@ from tool_assertion_classifier import (
 # Test Fixtures
 # ─────────────────────────────────────────────
 
-@dataclass
-class MockResponse:
-    """Mock response for enforcement testing."""
-    authority: str
-    system_mode: str
-    epistemic_state: str
+# Mock response for enforcement testing (attribute access only)
+MockResponse = namedtuple("MockResponse", "authority system_mode epistemic_state")
+
+
+@lru_cache(maxsize=None)
+def mock_response(authority: str, epistemic_state: str) -> MockResponse:
+    """Shared full-mode MockResponse for each (authority, epistemic_state) pair."""
+    return MockResponse(authority, "full", epistemic_state)
 
 
 def make_context_source(source_type: str, identifier: str = None) -> ContextSource:
@@ -62,259 +66,153 @@ def make_context_trace(
     )
 
 
-# ─────────────────────────────────────────────
-# Test 1: Sentinel Required + Sentinel Down
-# ─────────────────────────────────────────────
-
-class TestSentinelRequiredDown:
-    """Tests for when Sentinel is required but unavailable."""
-
-    def test_sentinel_required_and_missing_raises_context_unavailable(self):
-        """
-        If Sentinel is required but unavailable, ContextUnavailable MUST be raised.
-        No answer can be produced.
-        """
-        kernel = get_enforcement_kernel()
-        
-        # Response attempts to answer with system authority (derived from empty sources)
-        response = MockResponse(
-            authority="system",
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        # Context trace shows Sentinel was required but missing
-        trace = make_context_trace(
-            sources=[],
-            required_but_missing=["sentinel"]
-        )
-        
-        # Enforcement MUST block this
-        with pytest.raises(ContextUnavailable):
-            kernel.enforce(response, trace)
-
-    def test_sentinel_required_empty_sources_refusal_passes(self):
-        """
-        If query requires Sentinel and sources are empty, refusal is allowed.
-        Refusals are honest about having nothing.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="none",
-            system_mode="full",
-            epistemic_state="REFUSED"
-        )
-        
-        trace = make_context_trace(
-            sources=[],
-            required_but_missing=["sentinel"]
-        )
-        
-        # Refusals pass - they're honest about having nothing
-        # The required_but_missing check only blocks GROUNDED responses
-        kernel.enforce(response, trace)  # Should NOT raise
+# Traces shared by several cases (built once per session)
+SENTINEL_MISSING_TRACE = make_context_trace(
+    sources=[],
+    required_but_missing=["sentinel"]
+)
+SENTINEL_TRACE = make_context_trace(
+    sources=[
+        make_context_source("tool:sentinel", "sent_001")
+    ]
+)
+LIBRARY_TRACE = make_context_trace(
+    sources=[
+        make_context_source("library", "lib_001")
+    ]
+)
 
 
 # ─────────────────────────────────────────────
-# Test 2: Sentinel Required + Answer Attempted
-# ─────────────────────────────────────────────
-
-class TestSentinelRequiredAnswerAttempted:
-    """Tests for when Sentinel is required but answer is attempted without it."""
-
-    def test_answer_without_sentinel_when_required_fails(self):
-        """
-        If Sentinel is required but not used, answering with memory MUST fail.
-        """
-        kernel = get_enforcement_kernel()
-        
-        # Response claims memory authority without Sentinel
-        response = MockResponse(
-            authority="memory",
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        # Only memory sources, but Sentinel was required
-        trace = make_context_trace(
+# Enforcement Cases
+# (authority, epistemic_state, trace, expected exception or None)
+# ─────────────────────────────────────────────
+
+ENFORCEMENT_CASES = [
+    # Test 1: Sentinel Required + Sentinel Down
+    # Answering with system authority when Sentinel is missing MUST be blocked
+    pytest.param(
+        "system", "GROUNDED", SENTINEL_MISSING_TRACE, ContextUnavailable,
+        id="sentinel_required_and_missing_raises_context_unavailable",
+    ),
+    # Refusals pass - they're honest about having nothing
+    pytest.param(
+        "none", "REFUSED", SENTINEL_MISSING_TRACE, None,
+        id="sentinel_required_empty_sources_refusal_passes",
+    ),
+
+    # Test 2: Sentinel Required + Answer Attempted
+    # Memory sources cannot stand in for a required Sentinel
+    pytest.param(
+        "memory", "GROUNDED",
+        make_context_trace(
+            sources=[make_context_source("library", "lib_001")],
+            required_but_missing=["sentinel"],
+        ),
+        ContextUnavailable,
+        id="answer_without_sentinel_when_required_fails",
+    ),
+
+    # Test 3: Sentinel Returns Artifacts + Wrong Authority
+    # Sentinel artifacts require "tool" authority
+    pytest.param(
+        "memory", "GROUNDED", SENTINEL_TRACE, AuthorityViolation,
+        id="sentinel_artifacts_require_tool_authority",
+    ),
+    pytest.param(
+        "tool", "GROUNDED", SENTINEL_TRACE, None,
+        id="sentinel_artifacts_with_tool_authority_passes",
+    ),
+
+    # Test 4: Sentinel Partial Results + Wrong Authority
+    # Even partial Sentinel results require tool authority
+    pytest.param(
+        "memory", "GROUNDED",
+        make_context_trace(
+            sources=[make_context_source("tool:sentinel", "sent_partial")],
+        ),
+        AuthorityViolation,
+        id="partial_sentinel_results_still_require_tool_authority",
+    ),
+    # Tool and memory sources together: tool wins
+    pytest.param(
+        "memory", "GROUNDED",
+        make_context_trace(
             sources=[
-                make_context_source("library", "lib_001")
+                make_context_source("library", "lib_001"),
+                make_context_source("tool:sentinel", "sent_001"),
             ],
-            required_but_missing=["sentinel"]
-        )
-        
-        # Enforcement MUST block this
-        with pytest.raises(ContextUnavailable):
-            kernel.enforce(response, trace)
-
-
-# ─────────────────────────────────────────────
-# Test 3: Sentinel Returns Artifacts + Wrong Authority
-# ─────────────────────────────────────────────
-
-class TestSentinelArtifactsWrongAuthority:
-    """Tests for authority mismatch when Sentinel provides artifacts."""
-
-    def test_sentinel_artifacts_require_tool_authority(self):
-        """
-        If Sentinel returns artifacts, authority MUST be "tool".
-        Claiming "memory" is an AuthorityViolation.
-        """
-        kernel = get_enforcement_kernel()
-        
-        # Response claims memory authority
-        response = MockResponse(
-            authority="memory",  # WRONG - should be "tool"
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        # But sources include tool:sentinel
-        trace = make_context_trace(
-            sources=[
-                make_context_source("tool:sentinel", "sent_001")
-            ]
-        )
-        
-        # Enforcement MUST block this
-        with pytest.raises(AuthorityViolation):
-            kernel.enforce(response, trace)
-
-    def test_sentinel_artifacts_with_tool_authority_passes(self):
-        """
-        If Sentinel returns artifacts and authority is "tool", enforcement passes.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="tool",  # CORRECT
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        trace = make_context_trace(
-            sources=[
-                make_context_source("tool:sentinel", "sent_001")
-            ]
-        )
-        
-        # Should NOT raise
+        ),
+        AuthorityViolation,
+        id="mixed_sources_tool_wins",
+    ),
+
+    # Test 5: Sentinel Empty Results + Answer
+    # No tool sources means no tool authority
+    pytest.param(
+        "tool", "GROUNDED", make_context_trace(sources=[]), AuthorityViolation,
+        id="empty_sentinel_results_cannot_claim_tool_authority",
+    ),
+    # Library sources alone support memory authority
+    pytest.param(
+        "memory", "GROUNDED", LIBRARY_TRACE, None,
+        id="empty_results_with_memory_sources_ok",
+    ),
+
+    # Regression: No Silent Degradation
+    # A failed required tool cannot silently fall back to memory
+    pytest.param(
+        "memory", "GROUNDED",
+        make_context_trace(
+            sources=[make_context_source("library", "lib_fallback")],
+            required_but_missing=["sentinel"],
+        ),
+        ContextUnavailable,
+        id="tool_failure_cannot_silently_fallback_to_memory",
+    ),
+    # Refusal is the valid response when a tool is unavailable
+    pytest.param(
+        "none", "REFUSED", SENTINEL_MISSING_TRACE, None,
+        id="explicit_refusal_when_tool_unavailable_passes",
+    ),
+]
+
+
+@pytest.mark.parametrize("authority,epistemic_state,trace,exc", ENFORCEMENT_CASES)
+def test_enforce(kernel, authority, epistemic_state, trace, exc):
+    """
+    Enforcement MUST block every case with an expected exception
+    and MUST let every other case through.
+    """
+    response = mock_response(authority, epistemic_state)
+
+    with pytest.raises(exc) if exc else contextlib.nullcontext():
         kernel.enforce(response, trace)
 
 
 # ─────────────────────────────────────────────
-# Test 4: Sentinel Partial Results + Wrong Authority
-# ─────────────────────────────────────────────
-
-class TestSentinelPartialResults:
-    """Tests for partial Sentinel results."""
-
-    def test_partial_sentinel_results_still_require_tool_authority(self):
-        """
-        Even partial Sentinel results require tool authority.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="memory",  # WRONG
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        # Partial results from Sentinel
-        trace = make_context_trace(
-            sources=[
-                make_context_source("tool:sentinel", "sent_partial")
-            ]
-        )
-        
-        with pytest.raises(AuthorityViolation):
-            kernel.enforce(response, trace)
-
-    def test_mixed_sources_tool_wins(self):
-        """
-        If sources include both tool and memory, authority MUST be tool.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="memory",  # WRONG - tool should win
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        trace = make_context_trace(
-            sources=[
-                make_context_source("library", "lib_001"),
-                make_context_source("tool:sentinel", "sent_001")
-            ]
-        )
-        
-        with pytest.raises(AuthorityViolation):
-            kernel.enforce(response, trace)
-
-
-# ─────────────────────────────────────────────
-# Test 5: Sentinel Empty Results + Answer
+# Test: Query Classification Integration
 # ─────────────────────────────────────────────
 
-class TestSentinelEmptyResults:
-    """Tests for empty Sentinel results."""
-
-    def test_empty_sentinel_results_cannot_claim_tool_authority(self):
-        """
-        If Sentinel returns no artifacts, cannot claim tool authority.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="tool",  # WRONG - no tool sources
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        trace = make_context_trace(
-            sources=[]
-        )
-        
-        with pytest.raises(AuthorityViolation):
-            kernel.enforce(response, trace)
-
-    def test_empty_results_with_memory_sources_ok(self):
-        """
-        If Sentinel returns nothing but library has sources, memory authority is OK.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="memory",
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        trace = make_context_trace(
-            sources=[
-                make_context_source("library", "lib_001")
-            ]
-        )
-        
-        # Should NOT raise
-        kernel.enforce(response, trace)
+POSITIVE_SENTINEL = [
+    "Based on Sentinel results, what happened?",
+    "From Sentinel results, show me the data.",
+    "According to Sentinel, what was decided?",
+]
 
+NEGATIVE_SENTINEL = [
+    "What is HCSS?",
+    "Explain the 8825 architecture.",
+]
 
-# ─────────────────────────────────────────────
-# Test: Query Classification Integration
-# ─────────────────────────────────────────────
 
 class TestQueryClassificationIntegration:
     """Tests for query classification triggering tool requirements."""
 
-    def test_sentinel_assertion_detected(self):
+    @pytest.mark.parametrize("query", POSITIVE_SENTINEL)
+    def test_sentinel_assertion_detected(self, query):
         """Queries asserting Sentinel are detected."""
-        assert query_requires_sentinel("Based on Sentinel results, what happened?")
-        assert query_requires_sentinel("From Sentinel results, show me the data.")
-        assert query_requires_sentinel("According to Sentinel, what was decided?")
+        assert query_requires_sentinel(query)
 
     def test_internal_docs_assertion_detected(self):
         """Queries asserting internal documents are detected."""
@@ -322,62 +220,7 @@ class TestQueryClassificationIntegration:
         assert result.requires_tool is True
         assert result.tool_name == "internal_documents"
 
-    def test_normal_query_no_tool_required(self):
+    @pytest.mark.parametrize("query", NEGATIVE_SENTINEL)
+    def test_normal_query_no_tool_required(self, query):
         """Normal queries don't require tools."""
-        assert not query_requires_sentinel("What is HCSS?")
-        assert not query_requires_sentinel("Explain the 8825 architecture.")
-
-
-# ─────────────────────────────────────────────
-# Regression: No Silent Degradation
-# ─────────────────────────────────────────────
-
-class TestNoSilentDegradation:
-    """Tests ensuring no silent degradation when tools fail."""
-
-    def test_tool_failure_cannot_silently_fallback_to_memory(self):
-        """
-        If a tool was required and failed, cannot silently use memory.
-        """
-        kernel = get_enforcement_kernel()
-        
-        # Attempt to answer with memory after tool failure
-        response = MockResponse(
-            authority="memory",
-            system_mode="full",
-            epistemic_state="GROUNDED"
-        )
-        
-        # Tool was required but missing
-        trace = make_context_trace(
-            sources=[
-                make_context_source("library", "lib_fallback")
-            ],
-            required_but_missing=["sentinel"]
-        )
-        
-        # MUST raise - no silent fallback allowed
-        with pytest.raises(ContextUnavailable):
-            kernel.enforce(response, trace)
-
-    def test_explicit_refusal_when_tool_unavailable_passes(self):
-        """
-        When tool is unavailable, refusal is the valid response.
-        Refusals pass enforcement because they're honest about having nothing.
-        """
-        kernel = get_enforcement_kernel()
-        
-        response = MockResponse(
-            authority="none",
-            system_mode="full",
-            epistemic_state="REFUSED"
-        )
-        
-        trace = make_context_trace(
-            sources=[],
-            required_but_missing=["sentinel"]
-        )
-        
-        # Refusals pass - they're honest about having nothing
-        # The caller must handle the refusal appropriately
-        kernel.enforce(response, trace)  # Should NOT raise
+        assert not query_requires_sentinel(query)
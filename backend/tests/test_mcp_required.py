@@ -8,28 +8,36 @@ Verifies that:
 3. Removing REQUIRED MCPs breaks CI
 """
 
+import contextlib
+import importlib
 import pytest
-import sys
 import os
-from pathlib import Path
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def _import_mcp_chain(monkeypatch):
+    """
+    Import mcp_chain without its import-time validation against the real workspace.
+    
+    Importing at module scope would run that validation during collection and
+    abort the whole session on machines without a workspace root.
+    """
+    monkeypatch.setenv("MAESTRA_MINIMAL_MODE", "true")
+    return importlib.import_module("mcp_chain")
 
 
-def test_library_bridge_is_required():
+def test_library_bridge_is_required(monkeypatch):
     """Test that library_bridge is marked as REQUIRED."""
-    from mcp_chain import REQUIRED_MCPS
+    mcp_chain = _import_mcp_chain(monkeypatch)
     
-    assert "library_bridge" in REQUIRED_MCPS, \
+    assert "library_bridge" in mcp_chain.REQUIRED_MCPS, \
         "library_bridge must be in REQUIRED_MCPS"
 
 
-def test_context_builder_is_required():
+def test_context_builder_is_required(monkeypatch):
     """Test that context_builder is marked as REQUIRED."""
-    from mcp_chain import REQUIRED_MCPS
+    mcp_chain = _import_mcp_chain(monkeypatch)
     
-    assert "context_builder" in REQUIRED_MCPS, \
+    assert "context_builder" in mcp_chain.REQUIRED_MCPS, \
         "context_builder must be in REQUIRED_MCPS"
 
 
@@ -44,80 +52,36 @@ def test_required_mcps_exist():
         pytest.fail(f"REQUIRED MCP validation failed: {e}")
 
 
-def test_missing_library_bridge_fails_startup():
-    """Test that missing library_bridge causes startup failure."""
-    import tempfile
-    import shutil
-    from unittest.mock import patch
-    
-    # Create temp workspace without library_bridge
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mcp_dir = Path(tmpdir) / "mcp_servers"
-        mcp_dir.mkdir()
-        
-        # Create context_builder but NOT library_bridge
-        context_builder = mcp_dir / "context-builder"
-        context_builder.mkdir()
-        (context_builder / "server.js").write_text("// stub")
-        
-        # Mock workspace root to point to temp dir
-        with patch('mcp_chain.find_workspace_root', return_value=tmpdir):
-            from mcp_chain import validate_required_mcps
-            
-            with pytest.raises(RuntimeError, match="library_bridge"):
-                validate_required_mcps()
-
-
-def test_missing_context_builder_fails_startup():
-    """Test that missing context_builder causes startup failure."""
-    import tempfile
-    from unittest.mock import patch
-    
-    # Create temp workspace without context_builder
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mcp_dir = Path(tmpdir) / "mcp_servers"
-        mcp_dir.mkdir()
-        
-        # Create library_bridge but NOT context_builder
-        library_bridge = mcp_dir / "library-bridge"
-        library_bridge.mkdir()
-        (library_bridge / "server.js").write_text("// stub")
-        
-        # Mock workspace root to point to temp dir
-        with patch('mcp_chain.find_workspace_root', return_value=tmpdir):
-            from mcp_chain import validate_required_mcps
-            
-            with pytest.raises(RuntimeError, match="context_builder"):
-                validate_required_mcps()
-
-
-def test_optional_mcps_can_be_missing():
-    """Test that OPTIONAL MCPs can be missing without failing startup."""
-    import tempfile
-    from unittest.mock import patch
+FAKE_WORKSPACE_ROOT = "/fake/workspace"
+
+
+def _fake_mcp_exists(workspace_root, present):
+    """os.path.exists stand-in that only sees server.js stubs for the given MCPs."""
+    files = {
+        os.path.join(workspace_root, "mcp_servers", name, "server.js")
+        for name in present
+    }
+    return lambda path: path in files
+
+
+@pytest.mark.parametrize("present,missing_match", [
+    # Missing library_bridge fails startup
+    (["context-builder"], "library_bridge"),
+    # Missing context_builder fails startup
+    (["library-bridge"], "context_builder"),
+    # OPTIONAL MCPs (deep_research, project_planning) can be missing
+    (["library-bridge", "context-builder"], None),
+], ids=["missing_library_bridge", "missing_context_builder", "optional_mcps_missing"])
+def test_validate_required_mcps_startup(monkeypatch, present, missing_match):
+    """Startup fails exactly when a REQUIRED MCP is absent from the workspace."""
+    # The tree only exists in the faked os.path.exists; nothing touches disk
+    workspace_root = FAKE_WORKSPACE_ROOT
+    monkeypatch.setattr('library_accessor.find_workspace_root', lambda: workspace_root)
+    mcp_chain = _import_mcp_chain(monkeypatch)
+    monkeypatch.setattr('os.path.exists', _fake_mcp_exists(workspace_root, present))
     
-    # Create temp workspace with only REQUIRED MCPs
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mcp_dir = Path(tmpdir) / "mcp_servers"
-        mcp_dir.mkdir()
-        
-        # Create REQUIRED MCPs
-        for mcp_name in ["library-bridge", "context-builder"]:
-            mcp_path = mcp_dir / mcp_name
-            mcp_path.mkdir()
-            (mcp_path / "server.js").write_text("// stub")
-        
-        # Do NOT create deep_research or project_planning (OPTIONAL)
-        
-        # Mock workspace root to point to temp dir
-        with patch('mcp_chain.find_workspace_root', return_value=tmpdir):
-            from mcp_chain import validate_required_mcps
-            
-            # Should not raise - OPTIONAL MCPs can be missing
-            try:
-                validate_required_mcps()
-            except RuntimeError as e:
-                pytest.fail(f"Startup failed with only REQUIRED MCPs present: {e}")
+    with pytest.raises(RuntimeError, match=missing_match) if missing_match else contextlib.nullcontext():
+        mcp_chain.validate_required_mcps()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ These tests ensure:
 3. DF-5 and DF-6 failures are locked as regression tests
 """
 
+import re
+
 import pytest
 from refusal_normalizer import (
     detect_soft_refusal,
@@ -16,71 +18,57 @@ from refusal_normalizer import (
 )
 from tool_assertion_classifier import (
     classify_tool_assertion,
+    classify_tool_assertion_many,
     get_required_tools,
     query_requires_sentinel,
     ToolAssertionResult,
+    TOOL_ASSERTION_PATTERNS,
+    REQUIRED_LITERALS,
+    CASELESS,
+    _expand_literals,
 )
 
 
+# Only pure functions and the stateless kernel: safe to shard across xdist workers
+pytestmark = pytest.mark.stateless
+
+
 # ─────────────────────────────────────────────
 # HR-1: Soft Refusal Detection Tests
 # ─────────────────────────────────────────────
 
-class TestSoftRefusalDetection:
-    """Test soft refusal pattern detection."""
-
-    def test_detects_dont_have_access(self):
-        answer = "I don't have access to internal emails about Project X."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
-        assert pattern is not None
-
-    def test_detects_do_not_have_access(self):
-        answer = "I do not have access to that information."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
-
-    def test_detects_cannot_determine(self):
-        answer = "I cannot determine the answer from available sources."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
+SOFT_REFUSALS = [
+    pytest.param("I don't have access to internal emails about Project X.", id="dont_have_access"),
+    pytest.param("I do not have access to that information.", id="do_not_have_access"),
+    pytest.param("I cannot determine the answer from available sources.", id="cannot_determine"),
+    pytest.param("That information is not available in the library.", id="not_available"),
+    pytest.param("I was unable to find any documents about that topic.", id="unable_to_find"),
+    pytest.param("There is no information about Project X in the sources.", id="no_information_about"),
+    pytest.param("I currently do not have access to specific internal emails.", id="currently_do_not_have"),
+    pytest.param("The context does not provide specific details about that.", id="does_not_provide_specific"),
+]
 
-    def test_detects_not_available(self):
-        answer = "That information is not available in the library."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
-
-    def test_detects_unable_to_find(self):
-        answer = "I was unable to find any documents about that topic."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
+NOT_SOFT_REFUSALS = [
+    pytest.param("HCSS is a consulting company founded by Becky Hammer.", id="normal_answer"),
+    pytest.param("The system provides access to many documents.", id="partial_match"),
+]
 
-    def test_detects_no_information_about(self):
-        answer = "There is no information about Project X in the sources."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
 
-    def test_detects_currently_do_not_have(self):
-        answer = "I currently do not have access to specific internal emails."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is True
+class TestSoftRefusalDetection:
+    """Test soft refusal pattern detection."""
 
-    def test_detects_does_not_provide_specific(self):
-        answer = "The context does not provide specific details about that."
+    @pytest.mark.parametrize("answer", SOFT_REFUSALS)
+    def test_detects(self, answer):
         is_soft, pattern = detect_soft_refusal(answer)
         assert is_soft is True
+        assert pattern is not None
 
-    def test_does_not_detect_normal_answer(self):
-        answer = "HCSS is a consulting company founded by Becky Hammer."
+    @pytest.mark.parametrize("answer", NOT_SOFT_REFUSALS)
+    def test_does_not_detect(self, answer):
         is_soft, pattern = detect_soft_refusal(answer)
         assert is_soft is False
         assert pattern is None
 
-    def test_does_not_detect_partial_match(self):
-        answer = "The system provides access to many documents."
-        is_soft, pattern = detect_soft_refusal(answer)
-        assert is_soft is False
-
 
 # ─────────────────────────────────────────────
 # HR-1: Refusal Normalization Tests
@@ -179,49 +167,72 @@ class TestRefusalNormalization:
 class TestToolAssertionClassification:
     """Test tool assertion detection."""
 
-    def test_based_on_sentinel_requires_tool(self):
-        """'Based on Sentinel' requires Sentinel tool."""
-        query = "Based on Sentinel results, what did we decide about RAL?"
-        result = classify_tool_assertion(query)
-
-        assert result.requires_tool is True
-        assert result.required is True
-        assert result.tool_name == "sentinel"
-
-    def test_from_sentinel_results_requires_tool(self):
-        query = "From Sentinel results, summarize Project X."
+    @pytest.mark.parametrize("query,tool_name", [
+        pytest.param("Based on Sentinel results, what did we decide about RAL?", "sentinel",
+                     id="based_on_sentinel"),
+        pytest.param("From Sentinel results, summarize Project X.", "sentinel",
+                     id="from_sentinel_results"),
+        pytest.param("According to Sentinel, what is the architecture?", "sentinel",
+                     id="according_to_sentinel"),
+        pytest.param("From internal documents, what was decided?", "internal_documents",
+                     id="from_internal_documents"),
+        pytest.param("From internal emails, summarize the discussion.", "internal_documents",
+                     id="from_internal_emails"),
+        pytest.param("What is HCSS?", None, id="normal_query"),
+    ])
+    def test_classifies(self, query, tool_name):
         result = classify_tool_assertion(query)
 
-        assert result.requires_tool is True
-        assert result.tool_name == "sentinel"
+        assert result.requires_tool is (tool_name is not None)
+        assert result.required is (tool_name is not None)
+        assert result.tool_name == tool_name
 
-    def test_according_to_sentinel_requires_tool(self):
-        query = "According to Sentinel, what is the architecture?"
+    def test_higher_priority_tool_wins_regardless_of_position(self):
+        """Sentinel outranks deep_research even when asserted later in the query."""
+        query = "Research shows growth; based on Sentinel, what changed?"
         result = classify_tool_assertion(query)
 
-        assert result.requires_tool is True
         assert result.tool_name == "sentinel"
-
-    def test_from_internal_documents_requires_tool(self):
-        query = "From internal documents, what was decided?"
-        result = classify_tool_assertion(query)
-
-        assert result.requires_tool is True
-        assert result.tool_name == "internal_documents"
-
-    def test_from_internal_emails_requires_tool(self):
-        query = "From internal emails, summarize the discussion."
-        result = classify_tool_assertion(query)
-
-        assert result.requires_tool is True
-        assert result.tool_name == "internal_documents"
-
-    def test_normal_query_no_tool_required(self):
-        query = "What is HCSS?"
-        result = classify_tool_assertion(query)
-
-        assert result.requires_tool is False
-        assert result.tool_name is None
+        assert result.matched_pattern == "based on Sentinel"
+
+    def test_every_pattern_contains_required_literal(self):
+        """The substring prefilter must never reject a query a pattern could match."""
+        for tool_name, patterns in TOOL_ASSERTION_PATTERNS.items():
+            for pattern in patterns:
+                assert any(literal in pattern for literal in REQUIRED_LITERALS), \
+                    f"{tool_name} pattern {pattern!r} has no REQUIRED_LITERALS entry"
+
+    def test_expanded_literals_are_exactly_the_pattern(self):
+        """Aho-Corasick literals must each match their pattern in full."""
+        for patterns in TOOL_ASSERTION_PATTERNS.values():
+            for pattern in patterns:
+                literals = _expand_literals(pattern)
+                assert literals
+                for literal in literals:
+                    assert re.fullmatch(pattern, literal), (pattern, literal)
+
+    def test_every_pattern_compiles_under_re2(self):
+        """Patterns must stay RE2-compatible (no backreferences or lookaround)."""
+        re2 = pytest.importorskip("re2")
+        for tool_name, patterns in TOOL_ASSERTION_PATTERNS.items():
+            for pattern in patterns:
+                re2.compile(CASELESS + pattern)
+
+    def test_classify_many_matches_single_classification(self):
+        """Batch results equal per-query results, with no matches leaking across queries."""
+        queries = [
+            "From Sentinel results, summarize Project X.",
+            "What is HCSS?",
+            "based on",
+            "sentinel, please",
+            "",
+            "Research shows growth; based on Sentinel, what changed?",
+            "From internal emails, summarize the discussion.",
+        ]
+        assert classify_tool_assertion_many(queries) == [
+            classify_tool_assertion(query) for query in queries
+        ]
+        assert classify_tool_assertion_many([]) == []
 
     def test_get_required_tools_sentinel(self):
         query = "Based on Sentinel, what did we decide?"
@@ -237,6 +248,19 @@ class TestToolAssertionClassification:
         query = "What is the 8825 architecture?"
         assert query_requires_sentinel(query) is False
 
+    def test_query_requires_sentinel_agrees_with_classifier(self):
+        """The direct Sentinel gate must match the full classifier's verdict."""
+        queries = [
+            "Research shows X; from internal documents, what changed?",
+            "Based on deep research, what is trending?",
+            "Sentinel shows three incidents.",
+            "What is HCSS?",
+        ]
+        for query in queries:
+            result = classify_tool_assertion(query)
+            expected = result.tool_name in ("sentinel", "internal_documents")
+            assert query_requires_sentinel(query) is expected, query
+
 
 # ─────────────────────────────────────────────
 # HR-3: Dogfooding Regression Tests
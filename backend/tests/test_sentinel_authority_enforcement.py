@@ -29,6 +29,10 @@ from local_sentinel_adapter import (
 )
 
 
+# Only pure functions and the stateless kernel: safe to shard across xdist workers
+pytestmark = pytest.mark.stateless
+
+
 # ─────────────────────────────────────────────
 # Test Fixtures
 # ─────────────────────────────────────────────
@@ -41,28 +45,20 @@ class FakeResponse:
     system_mode: Literal["full", "minimal", "local_power"]
 
 
-@pytest.fixture
-def kernel():
-    return EnforcementKernel()
+# `kernel` is the session-scoped fixture from conftest.py
 
 
-@pytest.fixture
-def sentinel_context_source():
-    """A ContextSource from Sentinel."""
-    return ContextSource(source="tool:sentinel", identifier="art_12345")
+# A Sentinel context source and result, built once; no test mutates them
+SENTINEL_CS = ContextSource(source="tool:sentinel", identifier="art_12345")
 
-
-@pytest.fixture
-def sentinel_result():
-    """A SentinelResult for testing."""
-    return SentinelResult(
-        artifact_id="art_12345",
-        title="HCSS Architecture Overview",
-        excerpt="HCSS is a heavy civil construction software company...",
-        confidence=0.85,
-        source_path="/docs/hcss/architecture.md",
-        artifact_type="document"
-    )
+SENTINEL_RESULT = SentinelResult(
+    artifact_id="art_12345",
+    title="HCSS Architecture Overview",
+    excerpt="HCSS is a heavy civil construction software company...",
+    confidence=0.85,
+    source_path="/docs/hcss/architecture.md",
+    artifact_type="document"
+)
 
 
 # ─────────────────────────────────────────────
@@ -74,12 +70,12 @@ class TestSentinelRequiresToolAuthority:
     Prove: Sentinel context → authority MUST be "tool"
     """
 
-    def test_sentinel_context_requires_tool_authority(self, kernel, sentinel_context_source):
+    def test_sentinel_context_requires_tool_authority(self, kernel):
         """
         When Sentinel provides context, authority MUST be "tool".
         """
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",
         )
@@ -95,12 +91,12 @@ class TestSentinelRequiresToolAuthority:
         result = kernel.enforce(response_correct, context)
         assert result is None
 
-    def test_sentinel_context_with_memory_authority_blocked(self, kernel, sentinel_context_source):
+    def test_sentinel_context_with_memory_authority_blocked(self, kernel):
         """
         Sentinel context + memory authority → AuthorityViolation
         """
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",
         )
@@ -114,12 +110,12 @@ class TestSentinelRequiresToolAuthority:
         with pytest.raises(AuthorityViolation):
             kernel.enforce(response, context)
 
-    def test_sentinel_context_with_system_authority_blocked(self, kernel, sentinel_context_source):
+    def test_sentinel_context_with_system_authority_blocked(self, kernel):
         """
         Sentinel context + system authority → AuthorityViolation
         """
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",
         )
@@ -133,12 +129,12 @@ class TestSentinelRequiresToolAuthority:
         with pytest.raises(AuthorityViolation):
             kernel.enforce(response, context)
 
-    def test_sentinel_context_with_none_authority_blocked(self, kernel, sentinel_context_source):
+    def test_sentinel_context_with_none_authority_blocked(self, kernel):
         """
         Sentinel context + none authority (non-refusal) → AuthorityViolation
         """
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",
         )
@@ -215,14 +211,14 @@ class TestMixedSources:
     Prove: Tool sources take precedence in authority derivation
     """
 
-    def test_sentinel_plus_library_requires_tool_authority(self, kernel, sentinel_context_source):
+    def test_sentinel_plus_library_requires_tool_authority(self, kernel):
         """
         Sentinel + library sources → tool authority required (tool wins)
         """
         context = ContextTrace(
             sources=[
                 ContextSource(source="library", identifier="K-00001"),
-                sentinel_context_source,  # Tool source
+                SENTINEL_CS,  # Tool source
             ],
             required_but_missing=[],
             system_mode="local_power",
@@ -248,14 +244,14 @@ class TestMixedSources:
         result = kernel.enforce(response_correct, context)
         assert result is None
 
-    def test_sentinel_plus_system_requires_tool_authority(self, kernel, sentinel_context_source):
+    def test_sentinel_plus_system_requires_tool_authority(self, kernel):
         """
         Sentinel + system sources → tool authority required (tool wins)
         """
         context = ContextTrace(
             sources=[
                 ContextSource(source="system"),
-                sentinel_context_source,
+                SENTINEL_CS,
             ],
             required_but_missing=[],
             system_mode="local_power",
@@ -280,20 +276,20 @@ class TestSentinelResultConversion:
     Prove: SentinelResult correctly converts to ContextSource
     """
 
-    def test_sentinel_result_to_context_source(self, sentinel_result):
+    def test_sentinel_result_to_context_source(self):
         """
         SentinelResult.to_context_source() returns correct type.
         """
-        context_source = sentinel_result.to_context_source()
+        context_source = SENTINEL_RESULT.to_context_source()
         
         assert context_source.source == "tool:sentinel"
-        assert context_source.identifier == sentinel_result.artifact_id
+        assert context_source.identifier == SENTINEL_RESULT.artifact_id
 
-    def test_sentinel_result_context_source_triggers_tool_authority(self, kernel, sentinel_result):
+    def test_sentinel_result_context_source_triggers_tool_authority(self, kernel):
         """
         ContextSource from SentinelResult requires tool authority.
         """
-        context_source = sentinel_result.to_context_source()
+        context_source = SENTINEL_RESULT.to_context_source()
         
         context = ContextTrace(
             sources=[context_source],
@@ -314,12 +310,12 @@ class TestLocalPowerMode:
     Prove: Local Power Mode is correctly enforced
     """
 
-    def test_local_power_mode_with_sentinel(self, kernel, sentinel_context_source):
+    def test_local_power_mode_with_sentinel(self, kernel):
         """
         Local power mode + Sentinel → valid configuration
         """
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",
         )
@@ -334,14 +330,14 @@ class TestLocalPowerMode:
         result = kernel.enforce(response, context)
         assert result is None
 
-    def test_local_power_mode_mismatch_blocked(self, kernel, sentinel_context_source):
+    def test_local_power_mode_mismatch_blocked(self, kernel):
         """
         Claiming full mode when actual is local_power → ModeViolation
         """
         from enforcement_kernel import ModeViolation
         
         context = ContextTrace(
-            sources=[sentinel_context_source],
+            sources=[SENTINEL_CS],
             required_but_missing=[],
             system_mode="local_power",  # Actual mode
         )
@@ -0,0 +1,58 @@
+"""
+User Interaction Profile - library aggregation equivalence
+
+The pandas path (large libraries) must aggregate exactly like the
+pure-Python loop, including on malformed entries.
+"""
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from user_interaction_profile import (
+    UserProfileBuilder,
+    _aggregate_entries,
+    _aggregate_entries_pandas,
+)
+
+
+# Malformed or partial entries the library can hand us
+MALFORMED_ENTRIES = {
+    "none_tag": [{"tags": [None, "a"]}, {"tags": ["a", "b"]}],
+    "string_tags": [{"tags": "abc"}, {"tags": ["abc", "a"]}],
+    "tuple_tags": [{"tags": ("x", "y")}, {"tags": ["y"]}],
+    "empty_and_missing_tags": [{"tags": []}, {"tags": None}, {}, {"tags": ""}],
+    "falsy_types": [{"entry_type": ""}, {"entry_type": None}, {"entry_type": "knowledge"}, {}],
+    "falsy_content": [{"content": ""}, {"content": None}, {"content": "abcd"}, {}],
+    "no_columns": [{}, {}],
+}
+
+
+def _comparable(aggregate):
+    """Counters in most_common() order, so tie-breaking is compared too."""
+    tag_counts, type_counts, length_sum, length_n = aggregate
+    return tag_counts.most_common(), type_counts.most_common(), length_sum, length_n
+
+
+@pytest.mark.parametrize("name", MALFORMED_ENTRIES)
+def test_pandas_aggregation_matches_loop(name):
+    """Both aggregation paths agree on malformed entries"""
+    entries = MALFORMED_ENTRIES[name]
+    assert _comparable(_aggregate_entries_pandas(entries)) == _comparable(_aggregate_entries(entries))
+
+
+def test_tags_are_normalised():
+    """A bare string is one tag, and None tags are dropped"""
+    tag_counts, _, _, _ = _aggregate_entries([{"tags": "abc"}, {"tags": [None, "a"]}])
+    assert tag_counts == {"abc": 1, "a": 1}
+
+
+def test_rebuild_from_empty_library_drops_running_totals():
+    """build_from_library(user, []) starts the next incremental build from zero"""
+    builder = UserProfileBuilder()
+    builder.build_from_library("u1", [{"tags": ["old"]}])
+    builder.build_from_library("u1", [])
+
+    profile = builder.build_incremental("u1", [{"tags": ["new"]}])
+    assert profile.most_accessed_tags == ["new"]
+    assert profile.sample_size == 1
@@ -8,18 +8,47 @@ If a query asserts tool provenance but the tool is unavailable,
 the system MUST refuse — no fallback to library allowed.
 """
 
-import re
+import bisect
 import logging
+import functools
 from dataclasses import dataclass
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Optional: RE2 linear-time engine, immune to catastrophic backtracking
+# (falls back to stdlib re; both accept the patterns below unchanged)
+try:
+    import re2 as re
+    HAS_RE2 = True
+except ImportError:
+    import re
+    HAS_RE2 = False
+
+# Optional: Hyperscan multi-pattern matcher (falls back to stdlib re)
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+# Optional: Aho-Corasick literal matcher, used when Hyperscan is absent
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 
 # ─────────────────────────────────────────────
 # Tool Assertion Patterns
 # ─────────────────────────────────────────────
 
+# The regex engine tries a tool's alternatives left to right, so the order is
+# only a speed hint: no two alternatives of a tool can match at the same
+# position, so it never changes the result. The current order is not backed by
+# match-frequency data; reorder freely once such data exists.
 TOOL_ASSERTION_PATTERNS = {
     "sentinel": [
         r"based on sentinel",
@@ -30,15 +59,15 @@ TOOL_ASSERTION_PATTERNS = {
         r"sentinel results? (show|indicate|say)",
     ],
     "internal_documents": [
+        r"what did we decide",
         r"from internal documents?",
-        r"from archived files?",
         r"from internal emails?",
-        r"in (the|our) internal",
-        r"from (the|our) archives?",
-        r"internal (docs?|documents?|files?) (show|say|indicate)",
         r"historical decisions?",
-        r"what did we decide",
         r"according to internal docs?",
+        r"internal (docs?|documents?|files?) (show|say|indicate)",
+        r"in (the|our) internal",
+        r"from (the|our) archives?",
+        r"from archived files?",
         r"from (the|our) records?",
     ],
     "deep_research": [
@@ -48,20 +77,220 @@ TOOL_ASSERTION_PATTERNS = {
     ],
 }
 
+# Every pattern above contains at least one of these literals, so a query
+# containing none of them cannot match and skips the full pattern scan
+REQUIRED_LITERALS = (
+    "sentinel",
+    "internal",
+    "archive",
+    "research",
+    "record",
+    "decide",
+    "historical",
+)
+
+# Patterns are case-insensitive. RE2 has no IGNORECASE flag, so the inline
+# (?i) form is used for both engines.
+CASELESS = "(?i)"
+
+# Caseless prefilter over REQUIRED_LITERALS: no lowercased copy of the query
+_REQUIRED_LITERALS_RE = re.compile(
+    CASELESS + "|".join(re.escape(literal) for literal in REQUIRED_LITERALS)
+)
+
 # Compile patterns
 COMPILED_PATTERNS = {
-    tool: re.compile("|".join(patterns), re.IGNORECASE)
+    tool: re.compile(CASELESS + "|".join(patterns))
     for tool, patterns in TOOL_ASSERTION_PATTERNS.items()
 }
 
+# All tools in one regex, one named group per tool: a single search finds
+# the leftmost assertion and match.lastgroup names its tool
+FUSED_PATTERN = re.compile(
+    CASELESS + "|".join(
+        f"(?P<{tool}>{'|'.join(patterns)})"
+        for tool, patterns in TOOL_ASSERTION_PATTERNS.items()
+    )
+)
+
+# Tools backed by Sentinel, for the query_requires_sentinel() gate
+_SENTINEL_OR_INTERNAL = re.compile(
+    CASELESS + "|".join(
+        TOOL_ASSERTION_PATTERNS["sentinel"] + TOOL_ASSERTION_PATTERNS["internal_documents"]
+    )
+)
+
+# Tool names in priority order (first match wins); index == Hyperscan pattern id
+_TOOL_NAMES = tuple(TOOL_ASSERTION_PATTERNS)
+
+# (tool_name, compiled_pattern) pairs in the same order, frozen for per-call iteration
+_COMPILED_PATTERN_ITEMS = tuple(COMPILED_PATTERNS.items())
+
+
+def _build_hyperscan_db(mode=None, flags=None):
+    """Compile every tool's pattern into one Hyperscan database."""
+    if mode is None:
+        mode = hyperscan.HS_MODE_BLOCK
+    if flags is None:
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    db = hyperscan.Database(mode=mode)
+    db.compile(
+        expressions=[
+            "|".join(TOOL_ASSERTION_PATTERNS[tool]).encode("utf-8") for tool in _TOOL_NAMES
+        ],
+        ids=list(range(len(_TOOL_NAMES))),
+        flags=[flags] * len(_TOOL_NAMES),
+    )
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db() if HAS_HYPERSCAN else None
+
+# Vectored database for classify_tool_assertion_many(). A vectored scan is
+# one logical stream, so SINGLEMATCH would report each tool once per batch
+# rather than once per query; it is left off here.
+_HYPERSCAN_BATCH_DB = (
+    _build_hyperscan_db(hyperscan.HS_MODE_VECTORED, hyperscan.HS_FLAG_CASELESS)
+    if HAS_HYPERSCAN else None
+)
+
+# Placed between queries in a vectored scan; no pattern can match across it
+_BATCH_SEPARATOR = b"\x00"
+
+
+def _hyperscan_matched_tools(query: str) -> set:
+    """Names of all tools whose patterns match the query, in one DFA pass."""
+    matched_ids = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched_ids.add(pattern_id)
+
+    _HYPERSCAN_DB.scan(query.encode("utf-8"), match_event_handler=on_match)
+    return {_TOOL_NAMES[i] for i in matched_ids}
+
+
+def _hyperscan_matched_tools_many(queries: List[str]) -> List[set]:
+    """Per-query sets of matching tool names, from one vectored scan of the batch."""
+    buffers = []
+    ends = []  # Stream offset just past each query's bytes
+    offset = 0
+    for query in queries:
+        data = query.encode("utf-8")
+        buffers.append(data)
+        buffers.append(_BATCH_SEPARATOR)
+        offset += len(data)
+        ends.append(offset)
+        offset += len(_BATCH_SEPARATOR)
+
+    matched = [set() for _ in queries]
+
+    def on_match(pattern_id, start, end, flags, context):
+        # Match end offsets are stream-wide; map each back to its query
+        matched[bisect.bisect_left(ends, end)].add(_TOOL_NAMES[pattern_id])
+
+    if buffers:
+        _HYPERSCAN_BATCH_DB.scan(buffers, match_event_handler=on_match)
+    return matched
+
+
+def _expand_literals(pattern: str) -> List[str]:
+    """
+    Every literal string a tool pattern matches.
+    
+    Tool patterns only use flat (a|b) groups, optional (x)? groups and
+    optional single characters (s?), so each expands to a short finite
+    literal set.
+    """
+    variants = [""]
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "(":
+            close = pattern.index(")", i)
+            options = [
+                literal
+                for alternative in pattern[i + 1:close].split("|")
+                for literal in _expand_literals(alternative)
+            ]
+            i = close + 1
+        else:
+            options = [pattern[i]]
+            i += 1
+        if i < len(pattern) and pattern[i] == "?":
+            options = options + [""]
+            i += 1
+        variants = [variant + option for variant in variants for option in options]
+    return variants
+
+
+def _build_literal_automaton():
+    """Compile every tool's expanded literals into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for tool_name, patterns in TOOL_ASSERTION_PATTERNS.items():
+        for pattern in patterns:
+            for literal in _expand_literals(pattern):
+                automaton.add_word(literal, tool_name)
+    automaton.make_automaton()
+    return automaton
+
+
+_LITERAL_AUTOMATON = (
+    _build_literal_automaton() if HAS_AHOCORASICK and not HAS_HYPERSCAN else None
+)
+
+
+def _first_match_literals(query: str):
+    """(tool_name, match) via one Aho-Corasick pass over the lowered query, or (None, None)."""
+    matched_tools = {tool_name for _, tool_name in _LITERAL_AUTOMATON.iter(query.lower())}
+    return _first_match_among(query, matched_tools)
+
+
+def _first_match_hyperscan(query: str):
+    """(tool_name, match) for the highest-priority tool Hyperscan reports, or (None, None)."""
+    return _first_match_among(query, _hyperscan_matched_tools(query))
+
+
+def _first_match_among(query: str, matched_tools: set):
+    """(tool_name, match) for the highest-priority tool in matched_tools, or (None, None)."""
+    # Hyperscan / Aho-Corasick find every matching tool; re only extracts the
+    # matched text for the winning tool, so results match the stdlib path
+    for tool_name, pattern in _COMPILED_PATTERN_ITEMS:
+        if tool_name in matched_tools:
+            return tool_name, pattern.search(query)
+    return None, None
+
+
+def _first_match_fused(query: str):
+    """(tool_name, match) for the highest-priority matching tool, or (None, None)."""
+    match = FUSED_PATTERN.search(query)
+    if match is None:
+        return None, None
+    
+    # The fused search returns the leftmost assertion. A higher-priority tool
+    # asserted later in the query still wins, as with per-tool scans, so only
+    # those tools need a second look.
+    tool_name = match.lastgroup
+    for higher, pattern in _COMPILED_PATTERN_ITEMS[:_TOOL_NAMES.index(tool_name)]:
+        higher_match = pattern.search(query)
+        if higher_match:
+            return higher, higher_match
+    return tool_name, match
+
+
+# Map tool names to actual tool identifiers (read-only)
+_TOOL_MAPPING: Mapping[str, str] = MappingProxyType({
+    "sentinel": "sentinel",
+    "internal_documents": "sentinel",  # Internal docs = Sentinel
+    "deep_research": "deep_research",
+})
+
 
 # ─────────────────────────────────────────────
 # Classification Result
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolAssertionResult:
-    """Result of tool assertion classification."""
+    """Result of tool assertion classification (immutable; shared via the classifier cache)."""
     requires_tool: bool
     required: bool  # True = MUST have tool, False = optional
     tool_name: Optional[str]
@@ -70,10 +299,41 @@ class ToolAssertionResult:
     confidence: float = 1.0  # Confidence in the classification
 
 
+def _no_tool_result(query: str) -> ToolAssertionResult:
+    """Result for a query that asserts no tool."""
+    return ToolAssertionResult(
+        requires_tool=False,
+        required=False,
+        tool_name=None,
+        matched_pattern=None,
+        original_query=query
+    )
+
+
+def _result_for_match(query: str, tool_name: Optional[str], match) -> ToolAssertionResult:
+    """Build the classification result for a (tool_name, match) pair."""
+    if match:
+        logger.info(
+            "Tool assertion detected: tool=%s, pattern='%s', query='%s...'",
+            tool_name, match.group(), query[:50]
+        )
+        return ToolAssertionResult(
+            requires_tool=True,
+            required=True,  # MUST have this tool
+            tool_name=tool_name,
+            matched_pattern=match.group(),
+            original_query=query
+        )
+    
+    # No tool assertion found
+    return _no_tool_result(query)
+
+
 # ─────────────────────────────────────────────
 # Core Classification Function
 # ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4096)
 def classify_tool_assertion(query: str) -> ToolAssertionResult:
     """
     Classify a query for explicit tool assertions.
@@ -81,37 +341,50 @@ def classify_tool_assertion(query: str) -> ToolAssertionResult:
     If a query explicitly mentions a tool (e.g., "Based on Sentinel results..."),
     that tool becomes REQUIRED — not optional.
     
+    Results are memoized per query string, so repeated checks from
+    get_required_tools() / query_requires_sentinel() are a dict lookup.
+    
     Args:
         query: The user query
     
     Returns:
         ToolAssertionResult with tool requirements
     """
-    query_lower = query.lower()
-    
-    for tool_name, pattern in COMPILED_PATTERNS.items():
-        match = pattern.search(query_lower)
-        if match:
-            logger.info(
-                f"Tool assertion detected: tool={tool_name}, "
-                f"pattern='{match.group()}', query='{query[:50]}...'"
-            )
-            return ToolAssertionResult(
-                requires_tool=True,
-                required=True,  # MUST have this tool
-                tool_name=tool_name,
-                matched_pattern=match.group(),
-                original_query=query
-            )
+    # Fast path: most queries contain no required literal at all
+    if _REQUIRED_LITERALS_RE.search(query) is None:
+        return _no_tool_result(query)
     
-    # No tool assertion found
-    return ToolAssertionResult(
-        requires_tool=False,
-        required=False,
-        tool_name=None,
-        matched_pattern=None,
-        original_query=query
-    )
+    # Patterns are case-insensitive, so the query is scanned as-is
+    if _HYPERSCAN_DB is not None:
+        tool_name, match = _first_match_hyperscan(query)
+    elif _LITERAL_AUTOMATON is not None:
+        tool_name, match = _first_match_literals(query)
+    else:
+        tool_name, match = _first_match_fused(query)
+    
+    return _result_for_match(query, tool_name, match)
+
+
+def classify_tool_assertion_many(queries: List[str]) -> List[ToolAssertionResult]:
+    """
+    Classify a batch of queries for explicit tool assertions.
+    
+    With Hyperscan the whole batch is matched in one vectored scan;
+    otherwise each query goes through classify_tool_assertion().
+    
+    Args:
+        queries: The user queries
+    
+    Returns:
+        One ToolAssertionResult per query, in order
+    """
+    if _HYPERSCAN_BATCH_DB is None:
+        return [classify_tool_assertion(query) for query in queries]
+    
+    return [
+        _result_for_match(query, *_first_match_among(query, matched_tools))
+        for query, matched_tools in zip(queries, _hyperscan_matched_tools_many(queries))
+    ]
 
 
 def get_required_tools(query: str) -> List[str]:
@@ -126,13 +399,7 @@ def get_required_tools(query: str) -> List[str]:
     """
     result = classify_tool_assertion(query)
     if result.requires_tool and result.tool_name:
-        # Map tool names to actual tool identifiers
-        tool_mapping = {
-            "sentinel": "sentinel",
-            "internal_documents": "sentinel",  # Internal docs = Sentinel
-            "deep_research": "deep_research",
-        }
-        return [tool_mapping.get(result.tool_name, result.tool_name)]
+        return [_TOOL_MAPPING.get(result.tool_name, result.tool_name)]
     return []
 
 
@@ -146,8 +413,6 @@ def query_requires_sentinel(query: str) -> bool:
     Returns:
         True if Sentinel is required
     """
-    result = classify_tool_assertion(query)
-    return (
-        result.requires_tool and 
-        result.tool_name in ["sentinel", "internal_documents"]
-    )
+    # Sentinel and internal documents outrank deep_research, so either
+    # pattern firing means the classifier would pick a Sentinel-backed tool
+    return _SENTINEL_OR_INTERNAL.search(query) is not None
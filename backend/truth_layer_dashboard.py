@@ -6,14 +6,32 @@ Auto-refreshes every 30 seconds.
 Provides live status of truth layer enforcement.
 """
 
+import copy
 import logging
-from typing import Dict
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from observability import get_dashboard
 from epistemic_metrics import get_metrics_instance
 
 logger = logging.getLogger(__name__)
 
+# Human-readable summary, filled from a flattened live status
+_SUMMARY_TPL = """
+{status_emoji} Truth Layer Status: {status}
+
+📊 Metrics:
+  • Grounded: {grounded_pct}% (target: >80%)
+  • Refused: {refused_pct}% (target: <10%)
+  • Confidence: {avg_confidence} (target: >0.75)
+  • Response Time: {avg_response_time_ms}ms (target: <500ms)
+
+🚨 Alerts: {active_count} active
+
+Health: {health}
+""".strip()
+
 
 class TruthLayerDashboard:
     """Always-on dashboard for truth layer monitoring."""
@@ -21,14 +39,46 @@ class TruthLayerDashboard:
     def __init__(self):
         self.dashboard = get_dashboard()
         self.metrics = get_metrics_instance()
+        
+        # Live status is cached briefly so concurrent viewers and
+        # get_summary_text() share one aggregation per window
+        self._cache: Optional[Dict] = None
+        self._cache_ts = 0.0
+        self._ttl = 2.0
+        self._lock = threading.Lock()
+        
+        # (status dict, summary text rendered from it), replaced as one value
+        self._summary: Tuple[Optional[Dict], str] = (None, "")
     
     def get_live_status(self) -> Dict:
         """
         Get current truth layer status.
         
+        Cached for a short TTL; on expiry only one caller recomputes
+        while the others wait for its result. Each caller gets its own
+        copy of the cached dict.
+        
         Returns:
             Dictionary with live status metrics
         """
+        return copy.deepcopy(self._cached_live_status())
+    
+    def _cached_live_status(self) -> Dict:
+        """Return the shared TTL-cached status dict; callers must not mutate it."""
+        if self._cache is not None and time.monotonic() - self._cache_ts < self._ttl:
+            return self._cache
+        
+        with self._lock:
+            # Another caller may have refreshed while we waited
+            if self._cache is not None and time.monotonic() - self._cache_ts < self._ttl:
+                return self._cache
+            
+            self._cache = self._compute_live_status()
+            self._cache_ts = time.monotonic()
+            return self._cache
+    
+    def _compute_live_status(self) -> Dict:
+        """Aggregate metrics, alerts and health into the live status dict."""
         metrics = self.metrics.get_metrics()
         alerts = self.dashboard.get_alerts()
         health = self.metrics.get_health_status()
@@ -76,22 +126,22 @@ class TruthLayerDashboard:
     
     def get_summary_text(self) -> str:
         """Get human-readable summary."""
-        status = self.get_live_status()
+        status = self._cached_live_status()
         
-        summary = f"""
-{status['status_emoji']} Truth Layer Status: {status['status']}
-
-📊 Metrics:
-  • Grounded: {status['metrics']['grounded_pct']}% (target: >80%)
-  • Refused: {status['metrics']['refused_pct']}% (target: <10%)
-  • Confidence: {status['metrics']['avg_confidence']} (target: >0.75)
-  • Response Time: {status['metrics']['avg_response_time_ms']}ms (target: <500ms)
-
-🚨 Alerts: {status['alerts']['active_count']} active
-
-Health: {status['health'].upper()}
-"""
-        return summary.strip()
+        # Within the live-status TTL the cached dict is reused, and so is its text
+        summary_status, summary = self._summary
+        if status is summary_status:
+            return summary
+        
+        summary = _SUMMARY_TPL.format_map({
+            **status["metrics"],
+            "status_emoji": status["status_emoji"],
+            "status": status["status"],
+            "active_count": status["alerts"]["active_count"],
+            "health": status["health"].upper(),
+        })
+        self._summary = (status, summary)
+        return summary
 
 
 # Global instance
@@ -7,14 +7,157 @@ WITHOUT changing any response behavior.
 CRITICAL: This is observation-only. No branching logic should depend on these fields.
 """
 
+import functools
 import logging
+import os
 import re
+import time
+import warnings
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+# ─────────────────────────────────────────────
+# Classifier Patterns
+# ─────────────────────────────────────────────
+
+# Single-word signals are plain sets, checked against the query's \w+ tokens:
+# a word w is in the token set exactly when \bw\b matches. Only phrases and
+# structured patterns stay regexes.
+_WORD_RE = re.compile(r'\w+')
+
+# Reflect signals
+_REFLECT_PATTERNS = [
+    r'\bdoes this (feel|seem|look|sound)\b',
+    r'\bis this (right|correct|good|ok|okay)\b',
+    r'\bam i (missing|wrong|off)\b',
+    r'\bshould (i|we) be\b',
+    r'\bwhat do you think\b',
+    r'\bmake sense\b',
+]
+
+# Execute signals
+_EXECUTE_WORDS = frozenset({
+    "create", "make", "build", "generate", "write", "add", "update", "delete", "remove",
+    "run", "execute", "do", "perform", "apply", "implement",
+    "fix", "repair", "correct", "change",
+    "deploy", "publish", "ship", "launch",
+})
+_EXECUTE_PATTERNS = [
+    r'\blet\'s\b',
+    r'\bgo ahead\b',
+]
+
+_DEPTH_WORDS = frozenset({
+    "why", "how", "explain", "describe",
+    "analyze", "investigate", "audit", "examine", "inspect",
+    "reasoning", "rationale", "logic",
+    "detailed",
+})
+_DEPTH_PATTERNS = [
+    r'\b(show me|walk me through|break down)\b',
+    r'\b(deep dive|in depth)\b',
+    r'\bprompt\b.*\b(for|to)\b',  # "prompt for X"
+]
+
+_ALIGNMENT_WORDS = frozenset({"uncertain", "unsure", "confused", "lost"})
+_ALIGNMENT_PATTERNS = [
+    r'\bdoes this (feel|seem|look|sound)\b',
+    r'\bam i (missing|wrong|off|overthinking)\b',
+    r'\bshould (i|we) be (worried|concerned)\b',
+    r'\bis this (right|correct|the right)\b',
+    r'\bmake sense\b',
+]
+
+_TOOL_WORDS = frozenset({"script", "tool", "artifact", "template"})
+_TOOL_PATTERNS = [
+    r'\b(prompt|prompts)\b.*\b(for|to|that)\b',
+    r'\b(generate|create|write|make)\b.*\b(prompt|script|tool)\b',
+]
+
+
+def _fuse(patterns) -> re.Pattern:
+    """One alternation over patterns: a single search answers "does any match?"."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+# Compiled once at import, one regex per category
+_REFLECT_RE = _fuse(_REFLECT_PATTERNS)
+_EXECUTE_RE = _fuse(_EXECUTE_PATTERNS)
+_DEPTH_RE = _fuse(_DEPTH_PATTERNS)
+_ALIGNMENT_RE = _fuse(_ALIGNMENT_PATTERNS)
+_TOOL_RE = _fuse(_TOOL_PATTERNS)
+
+
+def _has_signal(query_lower: str, words: frozenset, regex: re.Pattern) -> bool:
+    """True if any signal word is a token of the query or the phrase regex matches."""
+    return (
+        not words.isdisjoint(_WORD_RE.findall(query_lower))
+        or regex.search(query_lower) is not None
+    )
+
+
+# (ISO string, epoch second) of the last timestamp handed out
+_last_iso = ("", -1)
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as an ISO string at one-second granularity.
+    
+    Formatting happens at most once per second; events within the same
+    second share the cached string.
+    """
+    global _last_iso
+    tick = int(time.time())
+    iso, cached_tick = _last_iso
+    if tick != cached_tick:
+        iso = datetime.utcfromtimestamp(tick).isoformat()
+        _last_iso = (iso, tick)
+    return iso
+
+
+# Queries longer than this are classified directly instead of being cached
+_CACHEABLE_QUERY_LEN = 2048
+
+# Memoized classifiers, for clear_classifier_caches()
+_CLASSIFIER_CACHE = []
+
+
+def _memoize_query(func):
+    """
+    Memoize a query classifier so duplicate turns (retries, re-renders)
+    skip all pattern work. Long queries bypass the cache.
+    """
+    cached = functools.lru_cache(maxsize=4096)(func)
+    _CLASSIFIER_CACHE.append(cached)
+
+    @functools.wraps(func)
+    def wrapper(query: str):
+        if len(query) > _CACHEABLE_QUERY_LEN:
+            return func(query)
+        return cached(query)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def clear_classifier_caches() -> None:
+    """Drop every memoized classification."""
+    for cached in _CLASSIFIER_CACHE:
+        cached.cache_clear()
+
+
+# Forked workers start with empty caches rather than copy-on-write pages
+# of the parent's
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=clear_classifier_caches)
+
+
+@_memoize_query
 def classify_query_type(query: str) -> str:
     """
     Classify query into explore/execute/reflect.
@@ -26,33 +169,18 @@ def classify_query_type(query: str) -> str:
     query_lower = query.lower()
     
     # Reflect signals
-    reflect_patterns = [
-        r'\bdoes this (feel|seem|look|sound)\b',
-        r'\bis this (right|correct|good|ok|okay)\b',
-        r'\bam i (missing|wrong|off)\b',
-        r'\bshould (i|we) be\b',
-        r'\bwhat do you think\b',
-        r'\bmake sense\b',
-    ]
-    if any(re.search(pattern, query_lower) for pattern in reflect_patterns):
+    if _REFLECT_RE.search(query_lower):
         return "reflect"
     
     # Execute signals
-    execute_patterns = [
-        r'\b(create|make|build|generate|write|add|update|delete|remove)\b',
-        r'\b(run|execute|do|perform|apply|implement)\b',
-        r'\b(fix|repair|correct|change)\b',
-        r'\b(deploy|publish|ship|launch)\b',
-        r'\blet\'s\b',
-        r'\bgo ahead\b',
-    ]
-    if any(re.search(pattern, query_lower) for pattern in execute_patterns):
+    if _has_signal(query_lower, _EXECUTE_WORDS, _EXECUTE_RE):
         return "execute"
     
     # Default to explore
     return "explore"
 
 
+@_memoize_query
 def detect_depth_requested(query: str) -> bool:
     """
     Detect if user is asking for reasoning, analysis, or investigation.
@@ -63,19 +191,10 @@ def detect_depth_requested(query: str) -> bool:
     - "show me", "walk me through"
     """
     query_lower = query.lower()
-    
-    depth_patterns = [
-        r'\b(why|how|explain|describe)\b',
-        r'\b(analyze|investigate|audit|examine|inspect)\b',
-        r'\b(show me|walk me through|break down)\b',
-        r'\b(reasoning|rationale|logic)\b',
-        r'\b(deep dive|in depth|detailed)\b',
-        r'\bprompt\b.*\b(for|to)\b',  # "prompt for X"
-    ]
-    
-    return any(re.search(pattern, query_lower) for pattern in depth_patterns)
+    return _has_signal(query_lower, _DEPTH_WORDS, _DEPTH_RE)
 
 
+@_memoize_query
 def detect_alignment_signal(query: str) -> bool:
     """
     Detect if user is expressing uncertainty or questioning intent.
@@ -87,19 +206,10 @@ def detect_alignment_signal(query: str) -> bool:
     - "is this the right approach"
     """
     query_lower = query.lower()
-    
-    alignment_patterns = [
-        r'\b(uncertain|unsure|confused|lost)\b',
-        r'\bdoes this (feel|seem|look|sound)\b',
-        r'\bam i (missing|wrong|off|overthinking)\b',
-        r'\bshould (i|we) be (worried|concerned)\b',
-        r'\bis this (right|correct|the right)\b',
-        r'\bmake sense\b',
-    ]
-    
-    return any(re.search(pattern, query_lower) for pattern in alignment_patterns)
+    return _has_signal(query_lower, _ALIGNMENT_WORDS, _ALIGNMENT_RE)
 
 
+@_memoize_query
 def detect_tools_requested(query: str) -> bool:
     """
     Detect if user is explicitly asking for prompts, tools, scripts, or artifacts.
@@ -110,14 +220,7 @@ def detect_tools_requested(query: str) -> bool:
     - "generate a tool"
     """
     query_lower = query.lower()
-    
-    tool_patterns = [
-        r'\b(prompt|prompts)\b.*\b(for|to|that)\b',
-        r'\b(script|tool|artifact|template)\b',
-        r'\b(generate|create|write|make)\b.*\b(prompt|script|tool)\b',
-    ]
-    
-    return any(re.search(pattern, query_lower) for pattern in tool_patterns)
+    return _has_signal(query_lower, _TOOL_WORDS, _TOOL_RE)
 
 
 def instrument_user_turn(
@@ -150,7 +253,7 @@ def instrument_user_turn(
         "alignment_signal": detect_alignment_signal(query),
         "tools_requested": detect_tools_requested(query),
         "query_length": len(query),
-        "instrumented_at": datetime.utcnow().isoformat(),
+        "instrumented_at": _iso_now(),
     }
     
     # Add epistemic classification results if provided
@@ -181,28 +284,38 @@ def instrument_assistant_turn(
     start_time_ms: Optional[int] = None,
     query_type: Optional[str] = None,
     tools_used: Optional[list] = None,
-    confidence: Optional[float] = None
+    confidence: Optional[float] = None,
+    start_time_ns: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Generate metadata for an assistant response turn.
     
     Args:
         response: Assistant response text
-        start_time_ms: Optional start timestamp for latency calculation
+        start_time_ms: Deprecated wall-clock start in epoch ms; use start_time_ns
         query_type: Optional query type from user turn
         tools_used: Optional list of tools/MCPs used
         confidence: Optional confidence score
+        start_time_ns: Optional time.perf_counter_ns() taken when the turn started
     
     Returns:
         Metadata dict to attach to ConversationTurn
     """
     metadata = {
         "response_length": len(response),
-        "instrumented_at": datetime.utcnow().isoformat(),
+        "instrumented_at": _iso_now(),
     }
     
-    if start_time_ms:
-        latency_ms = int((datetime.utcnow().timestamp() * 1000) - start_time_ms)
+    if start_time_ns is not None:
+        metadata["latency_ms"] = (time.perf_counter_ns() - start_time_ns) // 1_000_000
+    elif start_time_ms:
+        warnings.warn(
+            "instrument_assistant_turn(start_time_ms=...) is deprecated; "
+            "pass start_time_ns=time.perf_counter_ns()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        latency_ms = time.time_ns() // 1_000_000 - start_time_ms
         metadata["latency_ms"] = latency_ms
     
     if query_type:
@@ -8,13 +8,26 @@ CRITICAL: Profile is inferred, not user-editable. Never affects enforcement or a
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Optional: pandas for large library aggregations (falls back to pure Python)
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# Profiles below this confidence are never handed out
+MIN_PUBLIC_CONFIDENCE = 0.3
+
+# Below this many entries, DataFrame construction costs more than the loop saves
+PANDAS_MIN_ENTRIES = 1000
+
 
 @dataclass
 class UserInteractionProfile:
@@ -44,10 +57,112 @@ class UserInteractionProfile:
     sample_size: int = 0  # Number of sessions analyzed
     confidence: float = 0.0  # 0.0-1.0 based on sample size
     
+    @property
+    def is_public(self) -> bool:
+        """Whether confidence is high enough for get_profile() to return it."""
+        return self.confidence >= MIN_PUBLIC_CONFIDENCE
+    
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
+@dataclass
+class _LibraryAggregate:
+    """Running library totals for one user, updated one batch of entries at a time."""
+    tag_counts: Counter = field(default_factory=Counter)
+    type_counts: Counter = field(default_factory=Counter)
+    length_sum: int = 0  # Total content length
+    length_n: int = 0  # Entries with content
+    entry_count: int = 0
+
+
+def _entry_tags(entry: Dict[str, Any]) -> List[Any]:
+    """An entry's tags as a list: a bare string is one tag, and None tags are dropped."""
+    tags = entry.get("tags")
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        return [tags]
+    return [tag for tag in tags if tag is not None]
+
+
+def _aggregate_entries(
+    library_entries: List[Dict[str, Any]]
+) -> Tuple[Counter, Counter, int, int]:
+    """
+    Aggregate library entries in pure Python.
+    
+    Returns:
+        (tag counts, entry type counts, total content length, entries with content)
+    """
+    # One pass feeding the counters and running length totals directly
+    tag_counts = Counter()
+    type_counts = Counter()
+    length_sum = 0
+    length_n = 0
+    
+    for entry in library_entries:
+        # Tags (updating with an empty list is a no-op)
+        tag_counts.update(_entry_tags(entry))
+        
+        # Entry type
+        entry_type = entry.get("entry_type")
+        if entry_type:
+            type_counts[entry_type] += 1
+        
+        # Document length
+        content = entry.get("content")
+        if content:
+            length_sum += len(content)
+            length_n += 1
+    
+    return tag_counts, type_counts, length_sum, length_n
+
+
+def _counts_in_first_seen_order(series) -> Counter:
+    """
+    value_counts() as a Counter whose ties keep first-seen order,
+    so most_common() matches the pure-Python path.
+    """
+    counts = series.value_counts(sort=False)
+    return Counter(dict(zip(counts.index.tolist(), counts.tolist())))
+
+
+def _truthy(df, column: str):
+    """Values of a scalar column that are present and truthy, as the loop's `if value:`."""
+    if column not in df:
+        return pd.Series(dtype=object)
+    values = df[column].dropna()
+    return values[values.astype(bool)]
+
+
+def _aggregate_entries_pandas(
+    library_entries: List[Dict[str, Any]]
+) -> Tuple[Counter, Counter, int, int]:
+    """Same aggregation as _aggregate_entries(), as vectorized pandas column operations."""
+    df = pd.DataFrame.from_records(library_entries)
+    
+    # One row per tag, normalised exactly as the pure-Python path does
+    tags = pd.Series([_entry_tags(entry) for entry in library_entries], dtype=object)
+    tag_counts = _counts_in_first_seen_order(tags[tags.str.len() > 0].explode())
+    type_counts = _counts_in_first_seen_order(_truthy(df, "entry_type"))
+    
+    contents = _truthy(df, "content")
+    if contents.empty:
+        return tag_counts, type_counts, 0, 0
+    lengths = contents.str.len()
+    return tag_counts, type_counts, int(lengths.sum()), len(lengths)
+
+
+def _aggregate(
+    library_entries: List[Dict[str, Any]]
+) -> Tuple[Counter, Counter, int, int]:
+    """Aggregate with pandas for large batches, pure Python otherwise."""
+    if HAS_PANDAS and len(library_entries) >= PANDAS_MIN_ENTRIES:
+        return _aggregate_entries_pandas(library_entries)
+    return _aggregate_entries(library_entries)
+
+
 class UserProfileBuilder:
     """
     Builds UserInteractionProfile from library metadata and session data.
@@ -57,6 +172,8 @@ class UserProfileBuilder:
     
     def __init__(self):
         self.profiles: Dict[str, UserInteractionProfile] = {}
+        # Running library totals per user, so rebuilds cost O(new entries)
+        self._library_aggregates: Dict[str, _LibraryAggregate] = {}
     
     def build_from_library(
         self,
@@ -66,6 +183,9 @@ class UserProfileBuilder:
         """
         Build profile from personal library metadata.
         
+        Discards any running totals for the user and aggregates
+        library_entries from scratch.
+        
         Args:
             user_id: User identifier
             library_entries: List of library entry dicts with metadata
@@ -73,44 +193,62 @@ class UserProfileBuilder:
         Returns:
             UserInteractionProfile (read-only)
         """
+        self._library_aggregates.pop(user_id, None)
         if not library_entries:
             return UserInteractionProfile(user_id=user_id)
         
-        # Extract signals from library metadata
-        all_tags = []
-        entry_types = []
-        doc_lengths = []
-        
-        for entry in library_entries:
-            # Tags
-            tags = entry.get("tags", [])
-            if tags:
-                all_tags.extend(tags)
-            
-            # Entry type
-            entry_type = entry.get("entry_type")
-            if entry_type:
-                entry_types.append(entry_type)
-            
-            # Document length
-            content = entry.get("content", "")
-            if content:
-                doc_lengths.append(len(content))
+        return self.build_incremental(user_id, library_entries)
+    
+    def build_incremental(
+        self,
+        user_id: str,
+        new_entries: List[Dict[str, Any]]
+    ) -> UserInteractionProfile:
+        """
+        Fold newly added library entries into the user's running totals
+        and rebuild the profile from them.
+        
+        Args:
+            user_id: User identifier
+            new_entries: Library entries not yet seen for this user
+        
+        Returns:
+            UserInteractionProfile (read-only)
+        """
+        if not new_entries:
+            return self.profiles.get(user_id) or UserInteractionProfile(user_id=user_id)
+        
+        # Extract signals from the new library metadata only
+        return self._fold_aggregate(user_id, _aggregate(new_entries), len(new_entries))
+    
+    def _fold_aggregate(
+        self,
+        user_id: str,
+        batch: Tuple[Counter, Counter, int, int],
+        entry_count: int
+    ) -> UserInteractionProfile:
+        """Add one aggregated batch to the user's running totals and rebuild the profile."""
+        tag_counts, type_counts, length_sum, length_n = batch
+        
+        aggregate = self._library_aggregates.setdefault(user_id, _LibraryAggregate())
+        aggregate.tag_counts.update(tag_counts)
+        aggregate.type_counts.update(type_counts)
+        aggregate.length_sum += length_sum
+        aggregate.length_n += length_n
+        aggregate.entry_count += entry_count
         
         # Compute most accessed tags (top 5)
-        tag_counts = Counter(all_tags)
-        most_accessed_tags = [tag for tag, _ in tag_counts.most_common(5)]
+        most_accessed_tags = [tag for tag, _ in aggregate.tag_counts.most_common(5)]
         
-        # Compute entry type distribution
-        type_counts = Counter(entry_types)
-        total_types = sum(type_counts.values())
+        # Compute entry type distribution, most common type first
+        total_types = aggregate.type_counts.total()
         preferred_entry_types = {
             entry_type: count / total_types
-            for entry_type, count in type_counts.items()
+            for entry_type, count in aggregate.type_counts.most_common()
         } if total_types > 0 else {}
         
         # Compute average document length
-        avg_doc_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else None
+        avg_doc_length = aggregate.length_sum / aggregate.length_n if aggregate.length_n else None
         
         # Build profile
         profile = UserInteractionProfile(
@@ -118,12 +256,12 @@ class UserProfileBuilder:
             most_accessed_tags=most_accessed_tags,
             preferred_entry_types=preferred_entry_types,
             avg_doc_length=avg_doc_length,
-            sample_size=len(library_entries),
-            confidence=min(1.0, len(library_entries) / 20.0)  # Confidence increases with sample size
+            sample_size=aggregate.entry_count,
+            confidence=min(1.0, aggregate.entry_count / 20.0)  # Confidence increases with sample size
         )
         
         self.profiles[user_id] = profile
-        logger.info(f"Built profile for {user_id}: {len(library_entries)} entries, confidence={profile.confidence:.2f}")
+        logger.info(f"Built profile for {user_id}: {aggregate.entry_count} entries, confidence={profile.confidence:.2f}")
         
         return profile
     
@@ -193,10 +331,7 @@ class UserProfileBuilder:
         profile = self.profiles.get(user_id)
         
         # Only return profile if confidence is sufficient
-        if profile and profile.confidence >= 0.3:
-            return profile
-        
-        return None
+        return profile if profile and profile.is_public else None
 
 
 # Global profile builder instance
@@ -212,6 +347,6 @@ def get_user_profile(user_id: str) -> Optional[UserInteractionProfile]:
     """
     Get user interaction profile (read-only).
     
-    Returns None if insufficient data or confidence < 0.3.
+    Returns None if insufficient data or confidence < MIN_PUBLIC_CONFIDENCE.
     """
     return _profile_builder.get_profile(user_id)
@@ -2,15 +2,70 @@
 """
 Verify SyncScheduler is running by monitoring sync activity
 
-This test monitors the backend for 15 seconds to see if automatic sync attempts occur.
+This test monitors the backend for up to 15 seconds to see if automatic sync attempts occur.
+The local SyncScheduler pushes to its peers' POST /sync, so it waits on the hosted
+backend's /sync-events stream and stops at the first sync; backends without that
+endpoint fall back to a fixed 15-second wait.
 """
 
+import queue
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from datetime import datetime
 
 LOCAL_BACKEND = "http://localhost:8825"
 HOSTED_BACKEND = "https://maestra-backend-8825-systems.fly.dev"
+MONITOR_SECONDS = 15
+
+# One pooled session per backend, so repeat probes reuse the TCP/TLS connection
+_local = requests.Session()
+_hosted = requests.Session()
+_hosted.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+def wait_for_sync_event(timeout: float = MONITOR_SECONDS):
+    """
+    Block until the hosted backend reports a sync it received on /sync-events.
+    
+    The stream is read on a helper thread so the deadline holds even while
+    the server only sends keepalives.
+    
+    Returns:
+        The first `data:` payload, None if no sync arrived within timeout,
+        or False if the stream is unavailable (caller should fall back)
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        r = _hosted.get(f"{HOSTED_BACKEND}/sync-events", stream=True, timeout=timeout)
+    except requests.exceptions.Timeout:
+        return None
+    except requests.exceptions.RequestException:
+        return False
+    
+    with r:
+        if r.status_code != 200:
+            return False
+        
+        events: queue.Queue = queue.Queue()
+        
+        def read_events():
+            try:
+                # chunk_size=1: SSE lines are short and must not wait for a 512-byte buffer
+                for line in r.iter_lines(chunk_size=1, decode_unicode=True):
+                    if line and line.startswith("data:"):
+                        events.put(line[len("data:"):].strip())
+                        return
+            except requests.exceptions.RequestException:
+                pass  # stream closed at the deadline or dropped by the server
+            events.put(None)
+        
+        threading.Thread(target=read_events, daemon=True).start()
+        try:
+            return events.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return None
 
 
 def verify_sync_scheduler():
@@ -23,14 +78,14 @@ def verify_sync_scheduler():
     print(f"Time: {datetime.now().strftime('%H:%M:%S')}")
     
     try:
-        health = requests.get(f"{LOCAL_BACKEND}/health").json()
+        health = _local.get(f"{LOCAL_BACKEND}/health").json()
         print(f"✓ Local backend: {health['status']}")
     except Exception as e:
         print(f"✗ Local backend unreachable: {e}")
         return False
     
     try:
-        health = requests.get(f"{HOSTED_BACKEND}/health").json()
+        health = _hosted.get(f"{HOSTED_BACKEND}/health").json()
         print(f"✓ Hosted backend: {health['status']}")
     except Exception as e:
         print(f"✗ Hosted backend unreachable: {e}")
@@ -38,8 +93,8 @@ def verify_sync_scheduler():
     
     # Check peer registration
     print("\n[Peer Registration]")
-    local_peers = requests.get(f"{LOCAL_BACKEND}/peers").json()
-    hosted_peers = requests.get(f"{HOSTED_BACKEND}/peers").json()
+    local_peers = _local.get(f"{LOCAL_BACKEND}/peers").json()
+    hosted_peers = _hosted.get(f"{HOSTED_BACKEND}/peers").json()
     
     print(f"✓ Local backend has {len(local_peers['peers'])} peer(s)")
     print(f"✓ Hosted backend has {len(hosted_peers['peers'])} peer(s)")
@@ -55,22 +110,27 @@ def verify_sync_scheduler():
     print("  1. ConversationHub is available")
     print("  2. Peers are registered")
     print("  3. There are conversations to sync")
-    print("\nMonitoring for 15 seconds...")
+    print(f"\nMonitoring for up to {MONITOR_SECONDS} seconds...")
     
-    # We can't directly observe sync attempts without logs
-    # But we can verify the infrastructure is ready
-    
-    for i in range(15, 0, -1):
-        print(f"  {i}...", end=" ", flush=True)
-        time.sleep(1)
-    print("\n")
+    event = wait_for_sync_event()
+    if event:
+        print(f"✓ Sync observed: {event}\n")
+    elif event is None:
+        print(f"⚠ No sync observed within {MONITOR_SECONDS} seconds\n")
+    else:
+        # No /sync-events stream: we can't observe sync attempts without logs,
+        # but we can verify the infrastructure is ready
+        for i in range(MONITOR_SECONDS, 0, -1):
+            print(f"  {i}...", end=" ", flush=True)
+            time.sleep(1)
+        print("\n")
     
     # Final verification
     print("[Final Verification]")
     
     # Check if peers are still registered (sync didn't break anything)
-    local_peers_after = requests.get(f"{LOCAL_BACKEND}/peers").json()
-    hosted_peers_after = requests.get(f"{HOSTED_BACKEND}/peers").json()
+    local_peers_after = _local.get(f"{LOCAL_BACKEND}/peers").json()
+    hosted_peers_after = _hosted.get(f"{HOSTED_BACKEND}/peers").json()
     
     if len(local_peers_after['peers']) == len(local_peers['peers']):
         print("✓ Peer registration stable (sync didn't break anything)")
@@ -78,7 +138,7 @@ def verify_sync_scheduler():
         print("⚠ Peer count changed during monitoring")
     
     # Check backend health
-    health_after = requests.get(f"{LOCAL_BACKEND}/health").json()
+    health_after = _local.get(f"{LOCAL_BACKEND}/health").json()
     if health_after['status'] == 'healthy':
         print("✓ Local backend still healthy")
     else:
@@ -92,7 +152,7 @@ def verify_sync_scheduler():
     print("- ✓ Both backends are healthy")
     print("- ✓ Peers are registered")
     print("- ✓ Peer registration is stable")
-    print("- ✓ Backend survived 15-second monitoring period")
+    print("- ✓ Backend survived monitoring period")
     print("\nSyncScheduler Status:")
     print("- Infrastructure: READY")
     print("- Interval: 5 seconds")
@@ -3,88 +3,461 @@ Maestra Quad-Core Sidecar Service
 Runs on localhost:8826 with proper CORS for browser access
 """
 
-from flask import Flask, jsonify, request
+# Optional: gevent makes blocking sockets and file reads cooperative. When run
+# directly, patch before anything below imports socket or threading (gunicorn's
+# gevent worker patches on its own)
+try:
+    from gevent import monkey
+    HAS_GEVENT = True
+except ImportError:
+    HAS_GEVENT = False
+
+if HAS_GEVENT and __name__ == '__main__':
+    monkey.patch_all()
+
+# Optional: redis for a session store shared by every worker process
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+from flask import Flask, Response, jsonify, request
+from werkzeug.exceptions import HTTPException
+from werkzeug.wsgi import wrap_file
+from flask.json.provider import JSONProvider
+from cachetools import TTLCache
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
+import orjson
 import os
 from pathlib import Path
+import errno
 import logging
+import mmap
+import re
 import secrets
+import select
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
 
 # Configuration FIRST
 SIDECAR_PORT = 8826
+SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'memory')
+# Each worker process keeps its own in-memory sessions (so sessions_active and
+# handshake sessions are per worker) and its own library pack. Only a shared
+# redis session store makes several workers safe by default
+SIDECAR_WORKERS = int(os.getenv(
+    'SIDECAR_WORKERS', '4' if SESSION_BACKEND == 'redis' and HAS_REDIS else '1'
+))
+SIDECAR_THREADS = int(os.getenv('SIDECAR_THREADS', '8'))
+SIDECAR_WORKER_CLASS = os.getenv('SIDECAR_WORKER_CLASS', 'gevent' if HAS_GEVENT else 'gthread')
 LIBRARY_PATH = Path(os.getenv(
     'LIBRARY_PATH',
     '/Users/justinharmon/Hammer Consulting Dropbox/Justin Harmon/8825-Team/shared/8825-library'
 ))
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, for jsonify() and request.get_json()"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Session store
-_sessions = {}
+# Sessions expire 24h after handshake. SESSION_BACKEND=redis shares them across
+# gunicorn workers; the in-memory default is per process
+SESSION_TTL = timedelta(hours=24)
+SESSION_MAX = 100_000
+REDIS_URL = os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/0')
+
+
+class SessionStore:
+    """Where handshake sessions live"""
+    
+    def put(self, session_id, data):
+        raise NotImplementedError
+    
+    def get(self, session_id):
+        raise NotImplementedError
+    
+    def count(self):
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """This process only; least recently used sessions are evicted past SESSION_MAX"""
+    
+    def __init__(self):
+        self._sessions = TTLCache(maxsize=SESSION_MAX, ttl=SESSION_TTL.total_seconds())
+        self._lock = threading.Lock()  # TTLCache is not thread-safe
+    
+    def put(self, session_id, data):
+        with self._lock:
+            self._sessions[session_id] = data
+    
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+    
+    def count(self):
+        # expire() only walks sessions that have lapsed; len() is O(1)
+        with self._lock:
+            self._sessions.expire()
+            return len(self._sessions)
+
+
+class RedisSessionStore(SessionStore):
+    """Shared by every worker; redis expires the keys"""
+    
+    PREFIX = 'sess:'
+    # Sorted set of session_id -> expiry epoch, so count() needs no keyspace SCAN
+    INDEX = 'sess-index'
+    
+    def __init__(self, url):
+        self._redis = redis.Redis.from_url(url)
+    
+    def put(self, session_id, data):
+        now = time.time()
+        with self._redis.pipeline() as pipe:
+            pipe.setex(f'{self.PREFIX}{session_id}', SESSION_TTL, orjson.dumps(data))
+            pipe.zadd(self.INDEX, {session_id: now + SESSION_TTL.total_seconds()})
+            # Trim expired ids here too, so the index stays bounded without count()
+            pipe.zremrangebyscore(self.INDEX, '-inf', now)
+            pipe.execute()
+    
+    def get(self, session_id):
+        raw = self._redis.get(f'{self.PREFIX}{session_id}')
+        return orjson.loads(raw) if raw is not None else None
+    
+    def count(self):
+        # Drop expired ids, then read the cardinality: one round trip, O(log n)
+        with self._redis.pipeline() as pipe:
+            pipe.zremrangebyscore(self.INDEX, '-inf', time.time())
+            pipe.zcard(self.INDEX)
+            _, active = pipe.execute()
+        return active
+
+
+def make_session_store():
+    """Session store selected by SESSION_BACKEND (memory or redis)"""
+    if SESSION_BACKEND == 'redis':
+        if HAS_REDIS:
+            return RedisSessionStore(REDIS_URL)
+        logger.warning('SESSION_BACKEND=redis but redis is not installed, keeping sessions in memory')
+    elif SESSION_BACKEND != 'memory':
+        logger.warning(f'Unknown SESSION_BACKEND {SESSION_BACKEND!r}, keeping sessions in memory')
+    return MemorySessionStore()
+
+
+_sessions = make_session_store()
+
+# Random bytes per session token (22 URL-safe base64 characters)
+TOKEN_BYTES = 16
+
+# Valid library entry IDs: ASCII word characters and dashes, bounded length.
+# Also guarantees the ID can be written into JSON without escaping
+_ENTRY_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,128}')
+
+# Library index refresh interval (seconds)
+LIBRARY_CHECK_TTL = 10
+
+# LIBRARY_PATH.exists() result for health polls, at most 5s stale
+LIBRARY_EXISTS_TTL = 5
+_library_check = {'ts': float('-inf'), 'exists': False}
+
+# Packed copy of LIBRARY_PATH/*.json: one compact document per line in an
+# anonymous mmap'd file, with entry_id -> (offset, length, mtime_ns, size).
+# Re-packed in a background thread when the directory's mtime changes, checked
+# at most every LIBRARY_CHECK_TTL seconds. An entry is served from the pack only
+# while its file still has the packed mtime and size
+_library_index = {'ts': float('-inf'), 'mtime': None, 'packed': ({}, None), 'building': False}
+_library_index_lock = threading.Lock()
+
+# Capabilities every handshake advertises; brain-routing is added when the
+# local brain answers on port 5000, re-probed at most every 10s
+_BASE_CAPS = (
+    'library-access',
+    'learning-profiles',
+    'deep-context',
+    'offline-mode',
+    'capability-routing',
+)
+BRAIN_PORT = 5000
+BRAIN_CHECK_TTL = 10
+BRAIN_PROBE_TIMEOUT = 0.05  # seconds to wait for the connect to complete
+# SO_LINGER on with a zero timeout: close() resets the probe connection
+# instead of leaving it in TIME_WAIT
+_LINGER_RESET = struct.pack('ii', 1, 0)
+_brain_check = {'ts': float('-inf'), 'ok': False}
+_brain_check_lock = threading.Lock()
+
+
+# (ISO string, epoch second) of the last health/status timestamp
+_last_iso = ('', -1)
+
+
+def iso_now():
+    """UTC ISO timestamp at one-second granularity, formatted once per second"""
+    global _last_iso
+    tick = int(time.time())
+    iso, cached_tick = _last_iso
+    if tick != cached_tick:
+        iso = datetime.utcfromtimestamp(tick).isoformat()
+        _last_iso = (iso, tick)
+    return iso
+
+
+def library_available():
+    """Whether LIBRARY_PATH exists, without a stat() on every health poll"""
+    now = time.monotonic()
+    if now - _library_check['ts'] >= LIBRARY_EXISTS_TTL:
+        _library_check['exists'] = LIBRARY_PATH.exists()
+        _library_check['ts'] = now
+    return _library_check['exists']
+
+
+def _pack_library():
+    """Pack every library entry into an mmap'd NDJSON blob; returns (index, mm)"""
+    index = {}
+    offset = 0
+    with tempfile.TemporaryFile() as blob:
+        for entry_file in LIBRARY_PATH.glob('*.json'):
+            try:
+                with open(entry_file, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    line = orjson.dumps(orjson.loads(f.read()))
+            except (OSError, orjson.JSONDecodeError) as e:
+                logger.warning(f'Skipping unreadable library entry {entry_file.name}: {e}')
+                continue
+            blob.write(line + b'\n')
+            index[entry_file.stem] = (offset, len(line), st.st_mtime_ns, st.st_size)
+            offset += len(line) + 1
+        blob.flush()
+        # The mapping outlives the file object; an empty file can't be mapped
+        mm = mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_READ) if offset else None
+    logger.info(f'Packed {len(index)} library entries ({offset} bytes)')
+    return index, mm
+
+
+def _repack_library(mtime):
+    """Build a new pack for the directory at mtime and swap it in (background thread)"""
+    state = _library_index
+    old_mm = None
+    try:
+        packed = _pack_library() if mtime is not None else ({}, None)
+        with _library_index_lock:
+            old_mm = state['packed'][1]
+            state['packed'] = packed
+            state['mtime'] = mtime
+    except OSError as e:
+        # mtime stays unrecorded, so the next check tries again
+        logger.warning(f'Could not pack library: {e}')
+    finally:
+        state['building'] = False
+    # A request still slicing the old mapping gets ValueError and reads the file
+    if old_mm is not None:
+        old_mm.close()
+
+
+def library_index():
+    """(entry_id -> (offset, length, mtime_ns, size), mmap) for the last packed library contents"""
+    state = _library_index
+    if time.monotonic() - state['ts'] < LIBRARY_CHECK_TTL:
+        return state['packed']
+    
+    # One request re-checks; concurrent ones answer from the current pack
+    if not _library_index_lock.acquire(blocking=False):
+        return state['packed']
+    try:
+        try:
+            mtime = LIBRARY_PATH.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != state['mtime'] and not state['building']:
+            # Requests keep using the current pack until the new one is swapped in
+            state['building'] = True
+            threading.Thread(
+                target=_repack_library, args=(mtime,), name='library-pack', daemon=True
+            ).start()
+        state['ts'] = time.monotonic()
+        # The stat above also answers library_available() for a while
+        _library_check['exists'] = mtime is not None
+        _library_check['ts'] = state['ts']
+    finally:
+        _library_index_lock.release()
+    return state['packed']
+
+
+def _probe_brain():
+    """Non-blocking connect to the brain port, bounded by BRAIN_PROBE_TIMEOUT"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+        sock.setblocking(False)
+        err = sock.connect_ex(('127.0.0.1', BRAIN_PORT))
+        if err == 0:
+            return True
+        if err not in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            return False
+        _, writable, _ = select.select([], [sock], [], BRAIN_PROBE_TIMEOUT)
+        return bool(writable) and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def brain_available(ttl=BRAIN_CHECK_TTL):
+    """Whether the local brain accepts connections, without a probe per handshake"""
+    if time.monotonic() - _brain_check['ts'] < ttl:
+        return _brain_check['ok']
+    
+    # One handshake re-probes; concurrent ones answer from the previous result
+    if not _brain_check_lock.acquire(blocking=False):
+        return _brain_check['ok']
+    try:
+        _brain_check['ok'] = _probe_brain()
+        _brain_check['ts'] = time.monotonic()
+    finally:
+        _brain_check_lock.release()
+    return _brain_check['ok']
+
+
+def _entry_envelope(entry_id, entry_json):
+    """/library response body around an entry's JSON bytes (entry_id matches _ENTRY_ID_RE)"""
+    return (
+        b'{"success":true,"entry_id":"' + entry_id.encode()
+        + b'","entry":' + entry_json
+        + b',"source":"local-sidecar"}'
+    )
+
+
+@lru_cache(maxsize=1024)
+def _load_entry_payload(path_str, mtime_ns):
+    """Response body for an entry file outside the pack; mtime_ns in the key drops stale copies"""
+    path = Path(path_str)
+    # Round-trip to validate and compact before the bytes are cached
+    return _entry_envelope(path.stem, orjson.dumps(orjson.loads(path.read_bytes())))
+
+
+def library_entry_payload(entry_id):
+    """Complete /library response body for entry_id; None if missing"""
+    entry_file = LIBRARY_PATH / f'{entry_id}.json'
+    try:
+        st = entry_file.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    
+    index, mm = library_index()
+    span = index.get(entry_id)
+    if span is not None and span[2:] == (st.st_mtime_ns, st.st_size):
+        offset, length = span[:2]
+        try:
+            return _entry_envelope(entry_id, mm[offset:offset + length])
+        except ValueError:
+            pass  # this pack was replaced and closed meanwhile
+    
+    # Added, edited or replaced since the last pack; read (and cache) the file itself
+    return _load_entry_payload(str(entry_file), st.st_mtime_ns)
+
+@app.before_request
+def short_circuit_options():
+    """Answer every CORS preflight here, before any route runs; add_cors_headers still applies"""
+    if request.method == 'OPTIONS':
+        return '', 204
+
+# CORS headers sent on every response
+_CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+    'Access-Control-Max-Age': '3600',
+}
 
 @app.after_request
 def add_cors_headers(response):
     """Add CORS headers to EVERY response"""
-    response.headers['Access-Control-Allow-Origin'] = '*'
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With'
-    response.headers['Access-Control-Max-Age'] = '3600'
+    response.headers.update(_CORS)
     return response
 
-@app.route('/health', methods=['GET', 'OPTIONS'])
-def health():
-    if request.method == 'OPTIONS':
-        return '', 204
-    return jsonify({
-        'status': 'healthy',
-        'service': 'maestra-sidecar',
-        'version': '1.0.0',
-        'timestamp': datetime.utcnow().isoformat(),
-        'library_available': LIBRARY_PATH.exists(),
-        'mode': 'quad-core'
-    }), 200
-
-@app.route('/handshake', methods=['POST', 'OPTIONS'])
-def handshake():
-    if request.method == 'OPTIONS':
-        return '', 204
+# Serialized constant fields of the /health and /status bodies, without the
+# closing brace; handlers append only the per-request fields
+_HEALTH_PREFIX = orjson.dumps({
+    'status': 'healthy',
+    'service': 'maestra-sidecar',
+    'version': '1.0.0',
+    'mode': 'quad-core',
+})[:-1]
+_STATUS_PREFIX = orjson.dumps({
+    'service': 'maestra-sidecar',
+    'status': 'running',
+    'port': SIDECAR_PORT,
+    'mode': 'quad-core',
+})[:-1]
+
+
+def _json_bool(value):
+    return b'true' if value else b'false'
+
+
+@app.route('/health', methods=['GET'])
+def health(_iso_now=iso_now, _library_available=library_available, _response=Response):
+    # Globals bound as defaults: local loads on the most-polled endpoint
+    body = (
+        _HEALTH_PREFIX
+        + b',"timestamp":"' + _iso_now().encode()
+        + b'","library_available":' + _json_bool(_library_available())
+        + b'}'
+    )
+    return _response(body, mimetype='application/json')
+
+@app.route('/handshake', methods=['POST'])
+def handshake(_utcnow=datetime.utcnow, _jsonify=jsonify, _log=logger.debug):
+    # Globals bound as defaults: local loads instead of LOAD_GLOBAL per call
     try:
         data = request.get_json() or {}
         version = data.get('version', '1')
         user_agent = data.get('user_agent', 'unknown')
         
-        logger.info(f'Handshake request: version={version}, user_agent={user_agent}')
+        # DEBUG with lazy %-args: nothing is formatted unless the level is enabled
+        _log('Handshake request: version=%s, user_agent=%s', version, user_agent)
         
-        session_id = secrets.token_hex(16)
+        session_id = secrets.token_urlsafe(TOKEN_BYTES)
         
-        capabilities = [
-            'library-access',
-            'learning-profiles',
-            'deep-context',
-            'offline-mode',
-            'capability-routing',
-        ]
+        capabilities = list(_BASE_CAPS)
+        if brain_available():
+            capabilities.append('brain-routing')
         
-        # Check if local brain is available
-        try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('127.0.0.1', 5000))
-            sock.close()
-            if result == 0:
-                capabilities.append('brain-routing')
-        except:
-            pass
+        now = _utcnow()
         
-        _sessions[session_id] = {
-            'created_at': datetime.utcnow().isoformat(),
-            'expires_at': (datetime.utcnow() + timedelta(hours=24)).isoformat(),
+        _sessions.put(session_id, {
+            'created_at': now.isoformat(),
             'capabilities': capabilities,
             'user_agent': user_agent
-        }
+        })
         
         response = {
             'success': True,
@@ -93,58 +466,104 @@ def handshake():
             'library_id': 'local-8825-library',
             'capabilities': capabilities,
             'mode': 'quad-core',
-            'expires_at': (datetime.utcnow() + timedelta(hours=24)).isoformat(),
-            'library_path': str(LIBRARY_PATH) if LIBRARY_PATH.exists() else None,
+            'expires_at': (now + SESSION_TTL).isoformat(),
+            'library_path': str(LIBRARY_PATH) if library_available() else None,
         }
         
-        logger.info(f'Handshake successful: {session_id}')
-        return jsonify(response), 200
+        _log('Handshake successful: %s', session_id)
+        return _jsonify(response), 200
         
     except Exception as e:
         logger.error(f'Handshake error: {e}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _jsonify({'success': False, 'error': str(e)}), 500
 
-@app.route('/library/<entry_id>', methods=['GET', 'OPTIONS'])
+@app.route('/library/<entry_id>', methods=['GET'])
 def get_library_entry(entry_id):
-    if request.method == 'OPTIONS':
-        return '', 204
     try:
-        if not entry_id.replace('-', '').replace('_', '').isalnum():
+        if not _ENTRY_ID_RE.fullmatch(entry_id):
             return jsonify({'error': 'Invalid entry ID'}), 400
         
-        entry_file = LIBRARY_PATH / f'{entry_id}.json'
+        # ?wrap=1: the {"success", "entry_id", "entry", "source"} envelope
+        if request.args.get('wrap') == '1':
+            payload = library_entry_payload(entry_id)
+            
+            if payload is None:
+                return jsonify({'error': f'Entry {entry_id} not found'}), 404
+            
+            return Response(payload, mimetype='application/json')
         
-        if not entry_file.exists():
+        # Otherwise the entry file itself: sendfile(2) where the server supports
+        # it, with ETag / Last-Modified so repeat clients get a 304. One open()
+        # and an fstat() on the descriptor replace exists/stat/open lookups
+        try:
+            f = open(LIBRARY_PATH / f'{entry_id}.json', 'rb')
+        except (FileNotFoundError, IsADirectoryError):
             return jsonify({'error': f'Entry {entry_id} not found'}), 404
         
-        with open(entry_file, 'r') as f:
-            entry = json.load(f)
-        
-        return jsonify({
-            'success': True,
-            'entry_id': entry_id,
-            'entry': entry,
-            'source': 'local-sidecar'
-        }), 200
-        
+        try:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                f.close()
+                return jsonify({'error': f'Entry {entry_id} not found'}), 404
+            
+            # What send_file() would build from a path, without its extra stat()
+            rv = Response(wrap_file(request.environ, f), mimetype='application/json', direct_passthrough=True)
+            rv.content_length = st.st_size
+            rv.last_modified = int(st.st_mtime)
+            rv.set_etag(f'{st.st_mtime_ns:x}-{st.st_size:x}')
+            rv.cache_control.no_cache = True
+            return rv.make_conditional(request.environ, accept_ranges=True, complete_length=st.st_size)
+        except Exception:
+            f.close()
+            raise
+    
+    # e.g. 416 from make_conditional() for an unsatisfiable Range; keeps its
+    # headers (Content-Range) but answers in this API's JSON error shape
+    except HTTPException as e:
+        headers = [(k, v) for k, v in e.get_headers(request.environ) if k != 'Content-Type']
+        return jsonify({'error': e.description}), e.code, headers
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/status', methods=['GET', 'OPTIONS'])
+@app.route('/status', methods=['GET'])
 def status():
-    if request.method == 'OPTIONS':
-        return '', 204
-    return jsonify({
-        'service': 'maestra-sidecar',
-        'status': 'running',
-        'port': SIDECAR_PORT,
-        'mode': 'quad-core',
-        'library_available': LIBRARY_PATH.exists(),
-        'sessions_active': len(_sessions),
-        'timestamp': datetime.utcnow().isoformat()
-    }), 200
+    sessions_active = _sessions.count()
+    body = (
+        _STATUS_PREFIX
+        + b',"library_available":' + _json_bool(library_available())
+        + b',"sessions_active":' + str(sessions_active).encode()
+        + b',"timestamp":"' + iso_now().encode()
+        + b'"}'
+    )
+    return Response(body, mimetype='application/json')
 
 if __name__ == '__main__':
     logger.info(f'Starting Maestra Quad-Core Sidecar on port {SIDECAR_PORT}')
     logger.info(f'Library path: {LIBRARY_PATH}')
-    app.run(host='127.0.0.1', port=SIDECAR_PORT, debug=False)
+    
+    # Serve under gunicorn's gevent (or threaded) workers so requests overlap
+    # while one waits on the brain probe or a library read; without gunicorn use
+    # gevent's WSGI server, and the Werkzeug dev server only as a last resort
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        gunicorn = None
+    
+    if gunicorn is not None:
+        args = [
+            sys.executable, '-m', 'gunicorn',
+            '--chdir', str(Path(__file__).resolve().parent),
+            '--worker-class', SIDECAR_WORKER_CLASS,
+            '-w', str(SIDECAR_WORKERS),
+            '-b', f'127.0.0.1:{SIDECAR_PORT}',
+        ]
+        if SIDECAR_WORKER_CLASS == 'gthread':
+            args += ['--threads', str(SIDECAR_THREADS)]
+        os.execvp(sys.executable, args + ['server:app'])
+    elif HAS_GEVENT:
+        from gevent.pywsgi import WSGIServer
+        logger.warning('gunicorn not installed, serving with gevent WSGIServer')
+        WSGIServer(('127.0.0.1', SIDECAR_PORT), app).serve_forever()
+    else:
+        logger.warning('gunicorn not installed, falling back to the Flask dev server')
+        app.run(host='127.0.0.1', port=SIDECAR_PORT, debug=False)